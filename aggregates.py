@@ -0,0 +1,63 @@
+"""
+기간별 집계 표
+일자별 집계 프레임에서 화면에 표시할 기간별 표(최신순)를 만든다.
+"""
+import pandas as pd
+
+from rollup import API_COST_PER_CALL
+from store import slice_range
+
+
+def build_api_table(df_ai, start_date, end_date):
+    """AI API 사용 건수 표 (Date, Total Tokens, API Calls, Cost ($))"""
+    filtered = slice_range(df_ai, start_date, end_date)
+    if filtered.empty:
+        return pd.DataFrame()
+    # 공유 프레임의 슬라이스이므로 제자리 수정 대신 새 컬럼을 붙인 프레임 생성
+    api_df = filtered.assign(cost=filtered['count'] * API_COST_PER_CALL)
+    api_df = api_df.rename_axis('Date').reset_index().iloc[::-1]     # 오름차순 정렬 상태이므로 뒤집어서 최신순
+    api_df.columns = ['Date', 'Total Tokens', 'API Calls', 'Cost ($)']
+    return api_df
+
+
+def build_model_table(df_model, start_date, end_date):
+    """모델 생성 건수 표 (Date, Total Count, Standardized, Non-Standardized)"""
+    filtered_model_create = slice_range(df_model, start_date, end_date)
+    if filtered_model_create.empty:
+        return pd.DataFrame()
+    # 날짜별 집계는 DB에서 완료된 상태
+    model_create_grouped = filtered_model_create.reset_index()
+    model_create_grouped.columns = ['Date', 'Total Count', 'Standardized']
+    model_create_grouped['Non-Standardized'] = model_create_grouped['Total Count'] - model_create_grouped['Standardized']
+    return model_create_grouped.iloc[::-1]
+
+
+def build_photo_table(df_photo, start_date, end_date):
+    """사진 업로드 건수 표 (Date, Total Count, Total sgno, Total Web Open Chk)"""
+    filtered_photo_upload = slice_range(df_photo, start_date, end_date)
+    if filtered_photo_upload.empty:
+        return pd.DataFrame()
+    photo_upload_df = filtered_photo_upload.reset_index()
+    photo_upload_df.columns = ['Date', 'Total Count', 'Total sgno', 'Total Web Open Chk']
+    photo_upload_df['Total sgno'] = photo_upload_df['Total sgno'].astype(int)
+    photo_upload_df['Total Count'] = photo_upload_df['Total Count'].astype(int)
+    return photo_upload_df.iloc[::-1]
+
+
+def build_range_tables(frames, rollup, start_date, end_date):
+    """기간 하나의 화면 표 3개와 요약 카드 합계
+
+    Args:
+        frames: (ai_response, model_create, photo_upload) 일자별 집계
+        rollup: frames로 만든 DailyRollup
+
+    Returns:
+        {'api_df', 'model_df', 'photo_df', 'totals'}
+    """
+    df_ai, df_model, df_photo = frames
+    return {
+        'api_df': build_api_table(df_ai, start_date, end_date),
+        'model_df': build_model_table(df_model, start_date, end_date),
+        'photo_df': build_photo_table(df_photo, start_date, end_date),
+        'totals': rollup.totals(start_date, end_date),
+    }
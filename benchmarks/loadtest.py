@@ -0,0 +1,333 @@
+"""
+동시 접속 부하 테스트
+로컬 대체 DB(SQLite)에 연결한 대시보드를 이 프로세스 안에서 Streamlit 서버로 띄우고,
+브라우저 대신 웹소켓으로 접속하는 가상 사용자 N명이 동시에 기간 변경 / 행 선택(drill-down) /
+Data Reload / 전체 rerun을 반복하면서 동작별 응답 시간을 측정해서 JSON으로 저장한다.
+
+    python benchmarks/loadtest.py --users 20 --iterations 20
+    python benchmarks/loadtest.py --users 50 --rows 1000000 --think 0.5
+
+측정 항목
+    latency: 동작별 응답 시간 p50/p95/p99 (BackMsg 전송 ~ 마지막 script_finished 수신)
+    queries: 부하 구간 동안 대체 DB에서 실행된 쿼리 수
+    peak_rss_mb: 최대 RSS (서버와 가상 사용자가 같은 프로세스이므로 서버 메모리의 상한)
+
+AppTest는 실행할 때마다 프로세스 전역 상태(Runtime 등)를 바꾸므로 여러 세션을 동시에 돌릴 수 없어서
+실제 서버에 웹소켓으로 접속한다. 탭 전환은 브라우저 안에서만 일어나고 서버 rerun이 없으므로 따로 재지 않는다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import resource
+import signal
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+import warnings
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+import pandas as pd
+import streamlit as st
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from streamlit.web import bootstrap
+from tornado.websocket import websocket_connect
+
+import db
+from run_benchmarks import RESULTS_DIR, _git_revision
+from standin import QueryCounter, connection_factory, create_database
+
+
+DASHBOARD_PATH = ROOT_DIR / "dashboard.py"
+
+# 가상 사용자 동작과 선택 비율
+ACTION_WEIGHTS = {
+    'change_range': 5,     # 시작/종료 일 변경 (기간 fragment rerun)
+    'select_row': 2,       # 모델 표 행 선택 -> 원본 행 drill-down
+    'data_reload': 1,      # Data Reload 버튼 (증분 새로고침 후 전체 rerun)
+    'rerun': 2,            # 같은 위젯 값으로 전체 rerun
+}
+MAX_RANGE_DAYS = 60
+SERVER_START_TIMEOUT = 60
+RUN_TIMEOUT = 300
+
+FINISHED = ForwardMsg.ScriptFinishedStatus
+DONE_STATUSES = {FINISHED.FINISHED_SUCCESSFULLY, FINISHED.FINISHED_FRAGMENT_RUN_SUCCESSFULLY,
+                 FINISHED.FINISHED_WITH_COMPILE_ERROR}
+
+
+class Session:
+    """웹소켓으로 접속한 가상 사용자 한 명
+
+    서버가 보낸 delta에서 위젯 id와 위젯이 속한 fragment id를 기억하고,
+    브라우저처럼 현재 위젯 값 전체와 함께 rerun을 요청한다.
+    """
+
+    def __init__(self, url, rng):
+        self.url = url
+        self.rng = rng
+        self.ws = None
+        self.widgets = {}          # 이름 -> (위젯 id, fragment id)
+        self.states = {}           # 위젯 id -> WidgetState (값 위젯만)
+        self.errors = []
+
+    async def connect(self):
+        self.ws = await websocket_connect(self.url)
+        return await self.run()
+
+    def close(self):
+        if self.ws is not None:
+            self.ws.close()
+
+    async def run(self, fragment_id="", trigger=None):
+        """rerun 요청 후 실행이 끝날 때까지 기다린 시간(초)"""
+        msg = BackMsg()
+        client_state = msg.rerun_script
+        client_state.query_string = ""
+        client_state.page_script_hash = ""
+        client_state.fragment_id = fragment_id
+        for state in self.states.values():
+            client_state.widget_states.widgets.append(state)
+        if trigger is not None:
+            client_state.widget_states.widgets.append(WidgetState(id=trigger, trigger_value=True))
+
+        started = time.perf_counter()
+        await self.ws.write_message(msg.SerializeToString(), binary=True)
+        while True:
+            payload = await asyncio.wait_for(self.ws.read_message(), RUN_TIMEOUT)
+            if payload is None:
+                raise ConnectionError("server closed the websocket")
+            forward = ForwardMsg.FromString(payload)
+            kind = forward.WhichOneof('type')
+            if kind == 'delta':
+                self._record(forward.delta)
+            elif kind == 'script_finished' and forward.script_finished in DONE_STATUSES:
+                return time.perf_counter() - started
+
+    def _record(self, delta):
+        if delta.WhichOneof('type') != 'new_element':
+            return
+        element = delta.new_element
+        kind = element.WhichOneof('type')
+        if kind == 'exception':
+            self.errors.append(element.exception.message)
+        elif kind in ('date_input', 'button'):
+            widget = getattr(element, kind)
+            self.widgets[widget.label] = (widget.id, delta.fragment_id)
+        elif kind == 'arrow_data_frame' and element.arrow_data_frame.selection_mode:
+            widget_id = element.arrow_data_frame.id
+            name = 'model_table' if 'model_table' in widget_id else 'photo_table'
+            self.widgets[name] = (widget_id, delta.fragment_id)
+
+    # ------------------------------
+    # 동작
+    # ------------------------------
+    async def change_range(self):
+        end_date = date.today() - timedelta(days=self.rng.randrange(0, 30))
+        start_date = end_date - timedelta(days=self.rng.randrange(0, MAX_RANGE_DAYS))
+        start_id, fragment_id = self.widgets["시작 일"]
+        end_id, _ = self.widgets["종료 일"]
+        for widget_id, value in ((start_id, start_date), (end_id, end_date)):
+            self.states[widget_id] = WidgetState(id=widget_id, string_array_value={'data': [f"{value:%Y/%m/%d}"]})
+        return await self.run(fragment_id)
+
+    async def select_row(self):
+        widget_id, fragment_id = self.widgets["model_table"]
+        selection = {'selection': {'rows': [0], 'columns': [], 'cells': []}}
+        self.states[widget_id] = WidgetState(id=widget_id, string_value=json.dumps(selection))
+        return await self.run(fragment_id)
+
+    async def data_reload(self):
+        widget_id, fragment_id = self.widgets["Data Reload"]
+        return await self.run(fragment_id, trigger=widget_id)
+
+    async def rerun(self):
+        return await self.run()
+
+
+async def simulate_user(url, seed, iterations, think, latencies):
+    """가상 사용자 한 명: 접속 후 iterations번 동작"""
+    rng = random.Random(seed)
+    session = Session(url, rng)
+    actions = list(ACTION_WEIGHTS)
+    weights = list(ACTION_WEIGHTS.values())
+    try:
+        latencies['load'].append(await session.connect())
+        for _ in range(iterations):
+            await asyncio.sleep(rng.uniform(0, think))
+            action = rng.choices(actions, weights)[0]
+            latencies[action].append(await getattr(session, action)())
+    finally:
+        session.close()
+    return session.errors
+
+
+async def run_users(url, users, iterations, think, seed):
+    latencies = defaultdict(list)
+    results = await asyncio.gather(*(simulate_user(url, seed + index, iterations, think, latencies)
+                                     for index in range(users)))
+    return latencies, [error for errors in results for error in errors]
+
+
+# ------------------------------
+# 서버
+# ------------------------------
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for_server(port):
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while True:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return
+        except OSError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.2)
+
+
+def _percentiles(values):
+    if len(values) < 2:
+        value = values[0] if values else None
+        return {'p50_s': value, 'p95_s': value, 'p99_s': value, 'count': len(values)}
+    cuts = statistics.quantiles(values, n=100, method='inclusive')
+    return {'p50_s': cuts[49], 'p95_s': cuts[94], 'p99_s': cuts[98], 'max_s': max(values), 'count': len(values)}
+
+
+def _peak_rss_mb():
+    # Linux는 KB, macOS는 byte 단위
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent-session load test on a local SQLite stand-in")
+    parser.add_argument('--users', type=int, default=10, help="concurrent simulated sessions")
+    parser.add_argument('--iterations', type=int, default=20, help="actions per user after the first load")
+    parser.add_argument('--think', type=float, default=0.2, help="max random pause between actions (seconds)")
+    parser.add_argument('--rows', type=int, default=100000, help="rows per table in the stand-in DB")
+    parser.add_argument('--days', type=int, default=365, help="date span of the synthetic data")
+    parser.add_argument('--refresh-interval', type=float, default=0,
+                        help="dashboard refresh_interval (0: no periodic background refresh)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path, help="result JSON path (default: benchmarks/results/load_<timestamp>.json)")
+    args = parser.parse_args()
+
+    # pandas는 sqlite3 이외의 DBAPI 연결에 경고를 출력하므로 측정 중에는 숨김
+    warnings.filterwarnings('ignore', category=UserWarning)
+
+    print(f"preparing stand-in DB ({args.rows:,} rows per table) ...", flush=True)
+    path = create_database(args.rows, args.days, args.seed)
+    counter = QueryCounter()
+    # 대시보드는 서버 스크립트 스레드에서 db 모듈을 import하므로 여기서 바꾼 연결 함수를 사용한다
+    db.connection_factory = lambda: connection_factory(path, counter)
+    db.get_connection = connection_factory(path, counter)
+
+    workdir = tempfile.TemporaryDirectory(prefix="dashboard_loadtest_")
+    secrets_path = Path(workdir.name) / "secrets.toml"
+    secrets_path.write_text(
+        "[dashboard]\n"
+        f"snapshot_dir = {json.dumps(str(Path(workdir.name) / 'snapshot'))}\n"
+        f"refresh_interval = {args.refresh_interval}\n",
+        encoding="utf-8"
+    )
+    port = _free_port()
+    flag_options = {
+        'server_port': port,
+        'server_address': '127.0.0.1',
+        'server_headless': True,
+        'server_fileWatcherType': 'none',
+        'server_runOnSave': False,
+        'browser_gatherUsageStats': False,
+        'secrets_files': [str(secrets_path)],
+        'logger_level': 'error',
+    }
+
+    outcome = {}
+
+    def drive():
+        # 서버(메인 스레드 이벤트 루프)와 별도의 스레드에서 가상 사용자 실행
+        try:
+            _wait_for_server(port)
+            url = f"ws://127.0.0.1:{port}/_stcore/stream"
+            print("warming up ...", flush=True)
+            asyncio.run(run_users(url, 1, 0, 0, args.seed))
+            queries_before = counter.value
+            print(f"running {args.users} users x {args.iterations} actions ...", flush=True)
+            started = time.perf_counter()
+            latencies, errors = asyncio.run(run_users(url, args.users, args.iterations, args.think, args.seed))
+            outcome.update(duration_s=time.perf_counter() - started, latencies=latencies, errors=errors,
+                           queries=counter.value - queries_before, warmup_queries=queries_before)
+        except BaseException as e:
+            outcome['exception'] = e
+        finally:
+            os.kill(os.getpid(), signal.SIGTERM)
+
+    threading.Thread(target=drive, name="loadtest-users", daemon=True).start()
+    bootstrap.load_config_options(flag_options)
+    bootstrap.run(str(DASHBOARD_PATH), False, [], flag_options)
+    workdir.cleanup()
+    if 'exception' in outcome:
+        raise outcome['exception']
+
+    latency = {action: _percentiles(values) for action, values in sorted(outcome['latencies'].items())}
+    reruns = sum(summary['count'] for summary in latency.values())
+    report = {
+        'meta': {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'git_revision': _git_revision(),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'streamlit': st.__version__,
+            'platform': platform.platform(),
+            'users': args.users,
+            'iterations': args.iterations,
+            'think_s': args.think,
+            'rows_per_table': args.rows,
+            'days': args.days,
+            'refresh_interval': args.refresh_interval,
+        },
+        'duration_s': outcome['duration_s'],
+        'reruns': reruns,
+        'reruns_per_s': reruns / outcome['duration_s'],
+        'latency': latency,
+        'queries': outcome['queries'],
+        'warmup_queries': outcome['warmup_queries'],
+        'peak_rss_mb': _peak_rss_mb(),
+        'errors': outcome['errors'],
+    }
+
+    print(f"\n{reruns} reruns in {outcome['duration_s']:.1f}s ({report['reruns_per_s']:.1f}/s)")
+    for action, summary in latency.items():
+        print(f"  {action:<14} n={summary['count']:<5} p50 {summary['p50_s']:7.3f}s  "
+              f"p95 {summary['p95_s']:7.3f}s  p99 {summary['p99_s']:7.3f}s")
+    print(f"  queries        {report['queries']} (warm-up {report['warmup_queries']})")
+    print(f"  peak RSS       {report['peak_rss_mb']:.0f} MB")
+    if outcome['errors']:
+        print(f"  errors         {len(outcome['errors'])} (first: {outcome['errors'][0]})")
+
+    output = args.output or RESULTS_DIR / f"load_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"\nsaved {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+"""
+대시보드 단계별 벤치마크
+합성 데이터를 넣은 로컬 대체 DB(SQLite)를 규모별로 만들고 단계별 소요 시간을 측정해서
+JSON으로 저장한다. 이전 결과 파일과 비교해서 회귀 여부를 확인할 수 있다.
+
+    python benchmarks/run_benchmarks.py --scales 10000 100000 1000000
+    python benchmarks/run_benchmarks.py --scales 100000 --compare benchmarks/results/old.json
+
+측정 단계
+    query_raw: 원본 행 전체 조회 (예전 load_data 방식)
+    date_conversion_object / date_conversion_datetime64: date 컬럼 변환 (.dt.date vs datetime64)
+    grouping: 원본 행 pandas 일자별 집계
+    grouping_duckdb: 같은 집계를 DuckDB 엔진으로 (duckdb가 설치된 경우)
+    query_daily: MySQL GROUP BY 집계 조회 (현재 방식)
+    query_stream: chunk 단위 스트리밍 집계
+    query_stream_duckdb: DuckDB 엔진으로 chunk 집계하는 스트리밍 집계 (duckdb가 설치된 경우)
+    rollup_build: 일자별 롤업 생성
+    period_stats: calculate_period_stats (1/7/30일)
+    table_build: 기간별 표 생성
+    figure_build: 차트 3개 생성 + JSON 직렬화
+
+DuckDB 엔진 결과가 pandas 엔진 결과와 다르면 실패로 처리한다.
+일자별 집계 프레임은 대시보드에서 세션 간에 복사 없이 공유되므로, 롤업/표/차트 단계가
+끝난 뒤 내용이 바뀌었으면 실패로 처리한다.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import warnings
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+import pandas as pd
+
+from aggregates import build_api_table, build_model_table, build_photo_table
+from charts import build_ai_figure, build_model_figure, build_photo_figure
+from engines import create_engine
+from ingest import aggregate_chunk, stream_daily
+from queries import fetch_ai_daily, fetch_model_daily, fetch_photo_daily, fetch_raw_rows
+from rollup import DailyRollup, calculate_period_stats
+from store import TABLES, enable_copy_on_write, frame_checksum
+from standin import connection_factory, create_database
+
+
+RESULTS_DIR = Path(__file__).parent / "results"
+DEFAULT_SCALES = [10000, 100000, 1000000]
+
+
+def _time(func, repeat):
+    """func를 repeat번 실행한 소요 시간과 마지막 결과"""
+    runs = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        runs.append(time.perf_counter() - started)
+    return {'median_s': statistics.median(runs), 'min_s': min(runs), 'runs': runs}, result
+
+
+def _duckdb_engine():
+    try:
+        return create_engine('duckdb')
+    except RuntimeError:
+        return None
+
+
+def _check_same(engine, expected, actual):
+    for table in TABLES:
+        if not expected[table].equals(actual[table]):
+            raise RuntimeError(f"{engine} engine result differs from pandas for {table}")
+
+
+def run_scale(rows, days, repeat, seed):
+    """규모 하나에 대해 단계별 소요 시간 측정"""
+    today = date.today()
+    start_date, end_date = today - timedelta(days=days - 1), today
+    path = create_database(rows, days=days, seed=seed, today=today)
+    connect = connection_factory(path)
+    duckdb_engine = _duckdb_engine()
+    stages = {}
+
+    with connect() as conn:
+        stages['query_raw'], raw = _time(
+            lambda: {table: fetch_raw_rows(conn, table, start_date, end_date, 'standard_status') for table in TABLES},
+            repeat)
+        raw_dates = {table: frame['date'].astype(str) for table, frame in raw.items()}
+        stages['date_conversion_object'], _ = _time(
+            lambda: {table: pd.to_datetime(dates).dt.date for table, dates in raw_dates.items()}, repeat)
+        stages['date_conversion_datetime64'], _ = _time(
+            lambda: {table: pd.to_datetime(dates) for table, dates in raw_dates.items()}, repeat)
+        stages['grouping'], grouped = _time(
+            lambda: {table: aggregate_chunk(table, frame) for table, frame in raw.items()}, repeat)
+        if duckdb_engine is not None:
+            stages['grouping_duckdb'], grouped_duckdb = _time(
+                lambda: {table: duckdb_engine.aggregate(table, frame) for table, frame in raw.items()}, repeat)
+            _check_same('duckdb', grouped, grouped_duckdb)
+        stages['query_daily'], daily = _time(lambda: (
+            fetch_ai_daily(conn, start_date, end_date),
+            fetch_model_daily(conn, start_date, end_date, 'standard_status'),
+            fetch_photo_daily(conn, start_date, end_date),
+        ), repeat)
+        stages['query_stream'], streamed = _time(
+            lambda: {table: stream_daily(conn, table, start_date, end_date) for table in TABLES}, repeat)
+        if duckdb_engine is not None:
+            stages['query_stream_duckdb'], streamed_duckdb = _time(
+                lambda: {table: stream_daily(conn, table, start_date, end_date, engine=duckdb_engine)
+                         for table in TABLES}, repeat)
+            _check_same('duckdb', streamed, streamed_duckdb)
+
+    checksums = [frame_checksum(frame) for frame in daily]
+    stages['rollup_build'], rollup = _time(lambda: DailyRollup(*daily), repeat)
+    stages['period_stats'], _ = _time(
+        lambda: [calculate_period_stats(rollup, days_ago) for days_ago in (1, 7, 30)], repeat)
+    stages['table_build'], tables = _time(lambda: (
+        build_api_table(daily[0], start_date, end_date),
+        build_model_table(daily[1], start_date, end_date),
+        build_photo_table(daily[2], start_date, end_date),
+    ), repeat)
+    figure_builders = (build_ai_figure, build_model_figure, build_photo_figure)
+    stages['figure_build'], payloads = _time(
+        lambda: [builder(table).to_json() for builder, table in zip(figure_builders, tables)], repeat)
+    if [frame_checksum(frame) for frame in daily] != checksums:
+        raise RuntimeError("shared daily frames were modified by rollup/table/figure stages")
+
+    return {
+        'rows_per_table': rows,
+        'days': days,
+        'stages': stages,
+        'figure_payload_bytes': sum(len(payload) for payload in payloads),
+    }
+
+
+def _git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current, baseline):
+    """같은 규모/단계의 median 비교 (current / baseline)"""
+    baseline_by_rows = {result['rows_per_table']: result for result in baseline['results']}
+    for result in current['results']:
+        previous = baseline_by_rows.get(result['rows_per_table'])
+        if previous is None:
+            continue
+        print(f"\n[{result['rows_per_table']:,} rows] vs {baseline['meta'].get('git_revision')}")
+        for stage, timing in result['stages'].items():
+            if stage not in previous['stages']:
+                continue
+            before = previous['stages'][stage]['median_s']
+            ratio = timing['median_s'] / before if before else float('inf')
+            flag = "  <-- slower" if ratio > 1.2 else ""
+            print(f"  {stage:<28} {before:9.4f}s -> {timing['median_s']:9.4f}s  x{ratio:5.2f}{flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dashboard stage benchmarks on a local SQLite stand-in")
+    parser.add_argument('--scales', type=int, nargs='+', default=DEFAULT_SCALES,
+                        help="rows per table (e.g. 10000 100000 50000000)")
+    parser.add_argument('--days', type=int, default=365, help="date span of the synthetic data")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per stage")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path, help="result JSON path (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument('--compare', type=Path, help="previous result JSON to compare against")
+    args = parser.parse_args()
+
+    # pandas는 sqlite3 이외의 DBAPI 연결에 경고를 출력하므로 측정 중에는 숨김
+    warnings.filterwarnings('ignore', category=UserWarning)
+    enable_copy_on_write()
+
+    results = []
+    for rows in args.scales:
+        print(f"benchmarking {rows:,} rows per table ...", flush=True)
+        result = run_scale(rows, args.days, args.repeat, args.seed)
+        for stage, timing in result['stages'].items():
+            print(f"  {stage:<28} {timing['median_s']:9.4f}s")
+        results.append(result)
+
+    report = {
+        'meta': {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'git_revision': _git_revision(),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+        },
+        'results': results,
+    }
+    output = args.output or RESULTS_DIR / f"{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"\nsaved {output}")
+
+    if args.compare:
+        compare(report, json.loads(args.compare.read_text(encoding="utf-8")))
+
+
+if __name__ == '__main__':
+    main()
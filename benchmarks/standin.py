@@ -0,0 +1,173 @@
+"""
+로컬 대체 DB (SQLite)
+ai_response / model_create / photo_upload와 같은 컬럼 구성의 합성 데이터를 만들고,
+대시보드 쿼리(MySQL %s 파라미터 형식)를 그대로 실행할 수 있는 연결을 제공한다.
+"""
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+
+DATA_DIR = Path(__file__).parent / ".data"
+
+SCHEMA_SQL = [
+    """CREATE TABLE ai_response (
+        id INTEGER PRIMARY KEY, job_id INTEGER, token INTEGER, date TEXT)""",
+    """CREATE TABLE model_create (
+        id INTEGER PRIMARY KEY, model_id INTEGER, standard_status INTEGER, date TEXT)""",
+    """CREATE TABLE photo_upload (
+        id INTEGER PRIMARY KEY, sgno TEXT, count INTEGER, web_open_chk INTEGER, date TEXT)""",
+    "CREATE INDEX ix_ai_response_date ON ai_response (date)",
+    "CREATE INDEX ix_model_create_date ON model_create (date)",
+    "CREATE INDEX ix_photo_upload_date ON photo_upload (date)",
+]
+
+BATCH_SIZE = 100000
+
+
+def _random_datetimes(rng, size, days, today):
+    """오늘 기준 최근 days일 안의 임의 시각 ('YYYY-MM-DD HH:MM:SS')"""
+    start = np.datetime64(today - timedelta(days=days - 1))
+    seconds = rng.integers(0, days * 86400, size=size)
+    stamps = (start + seconds.astype('timedelta64[s]')).astype(str)
+    return np.char.replace(stamps, 'T', ' ')
+
+
+def _generate_batch(table, rng, size, days, today):
+    stamps = _random_datetimes(rng, size, days, today)
+    if table == 'ai_response':
+        return zip(rng.integers(1, 10**6, size).tolist(), rng.integers(100, 20000, size).tolist(), stamps.tolist())
+    if table == 'model_create':
+        return zip(rng.integers(1, 10**6, size).tolist(), rng.integers(0, 2, size).tolist(), stamps.tolist())
+    sgno = np.char.add('SG', rng.integers(0, max(size // 5, 1), size).astype(str))
+    return zip(sgno.tolist(), rng.integers(1, 20, size).tolist(), rng.integers(0, 2, size).tolist(), stamps.tolist())
+
+
+INSERT_SQL = {
+    'ai_response': "INSERT INTO ai_response (job_id, token, date) VALUES (?, ?, ?)",
+    'model_create': "INSERT INTO model_create (model_id, standard_status, date) VALUES (?, ?, ?)",
+    'photo_upload': "INSERT INTO photo_upload (sgno, count, web_open_chk, date) VALUES (?, ?, ?, ?)",
+}
+
+
+def create_database(rows, days=365, seed=0, path=None, today=None):
+    """테이블마다 rows건의 합성 데이터를 가진 SQLite 파일 생성
+
+    같은 (rows, days, seed, today) 조합의 파일이 이미 있으면 다시 만들지 않는다.
+
+    Returns:
+        SQLite 파일 경로
+    """
+    today = today or date.today()
+    if path is None:
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        path = DATA_DIR / f"standin_{rows}_{days}_{seed}_{today:%Y%m%d}.db"
+    path = Path(path)
+    if path.exists():
+        return path
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        for sql in SCHEMA_SQL:
+            conn.execute(sql)
+        rng = np.random.default_rng(seed)
+        for table, insert_sql in INSERT_SQL.items():
+            for offset in range(0, rows, BATCH_SIZE):
+                size = min(BATCH_SIZE, rows - offset)
+                conn.executemany(insert_sql, _generate_batch(table, rng, size, days, today))
+        conn.commit()
+    finally:
+        conn.close()
+    tmp_path.rename(path)
+    return path
+
+
+def _adapt(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat(sep=' ') if isinstance(value, datetime) else value.isoformat()
+    return value
+
+
+class StandInCursor:
+    """MySQL 형식(%s) 쿼리를 SQLite(?) 형식으로 바꿔서 실행하는 커서"""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self._cursor = connection.raw.cursor()
+
+    def execute(self, sql, params=()):
+        self.connection.count_query()
+        self._cursor.execute(sql.replace('%s', '?'), tuple(_adapt(value) for value in params or ()))
+        return self
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+
+class StandInConnection:
+    """mysql.connector 연결 대신 사용할 SQLite 연결
+
+    query_count: 이 연결로 실행한 쿼리 수
+    """
+
+    def __init__(self, path, counter=None):
+        self.raw = sqlite3.connect(path, check_same_thread=False)
+        self.counter = counter
+        self.query_count = 0
+
+    def count_query(self):
+        self.query_count += 1
+        if self.counter is not None:
+            self.counter.increment()
+
+    def cursor(self, *args, **kwargs):
+        # buffered 등 mysql.connector 전용 인자는 무시
+        return StandInCursor(self)
+
+    def ping(self, *args, **kwargs):
+        pass
+
+    def commit(self):
+        self.raw.commit()
+
+    def close(self):
+        self.raw.close()
+
+
+class QueryCounter:
+    """여러 연결/스레드에서 실행된 쿼리 수 합계"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.value = 0
+
+    def increment(self):
+        with self.lock:
+            self.value += 1
+
+
+def connection_factory(path, counter=None):
+    """db.connection_factory()와 같은 형태의 연결 함수 반환
+
+        connect = connection_factory(path)
+        with connect() as conn:
+            ...
+    """
+    @contextmanager
+    def connect():
+        conn = StandInConnection(path, counter)
+        try:
+            yield conn
+        finally:
+            conn.close()
+    return connect
@@ -0,0 +1,229 @@
+"""
+대시보드 차트 생성
+화면(Streamlit)과 분리해 두어 벤치마크 등에서 figure 생성 비용만 따로 측정할 수 있다.
+
+조회 기간이 길어지면 막대/점 개수만큼 Plotly JSON과 브라우저 렌더링 비용이 늘어나므로
+기간에 따라 일/주/월 단위로 묶어서 그리고, 점이 많은 선 차트는 WebGL(Scattergl)로 그린다.
+"""
+import pandas as pd
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+
+# 트레이스당 최대 점 개수: 일 단위로 그렸을 때 이 값을 넘으면 주 → 월 단위로 묶음
+MAX_POINTS = 400
+# (resample 규칙, 하루 기준 묶음 크기, 표시 이름). 주 단위는 월요일 시작
+RESOLUTIONS = [
+    ('D', 1, '일'),
+    ('W-MON', 7, '주'),
+    ('MS', 30, '월'),
+]
+# 선/점 차트의 점 개수가 이 값을 넘으면 SVG 대신 WebGL로 렌더링
+SCATTERGL_THRESHOLD = 250
+
+
+def choose_resolution(span_days, max_points=MAX_POINTS):
+    """기간(일)에 맞는 가장 세밀한 단위 선택 (묶음 개수가 max_points 이하)"""
+    for rule, days, label in RESOLUTIONS:
+        if span_days / days <= max_points:
+            return rule, label
+    return RESOLUTIONS[-1][0], RESOLUTIONS[-1][2]
+
+
+def downsample(table_df, max_points=MAX_POINTS):
+    """기간 표(Date + 합계 컬럼)를 차트용 단위로 묶음
+
+    Returns:
+        (Date 오름차순 차트 데이터프레임, 단위 표시 이름)
+    """
+    chart_df = table_df.copy()
+    chart_df['Date'] = pd.to_datetime(chart_df['Date'])
+    chart_df = chart_df.sort_values('Date')
+    span_days = (chart_df['Date'].iloc[-1] - chart_df['Date'].iloc[0]).days + 1
+    rule, label = choose_resolution(span_days, max_points)
+    if rule == 'D':
+        return chart_df, label
+    # 모든 컬럼이 일자별 합계이므로 묶음 단위로 다시 합산 (벡터 연산)
+    chart_df = (chart_df.set_index('Date')
+                .resample(rule, label='left', closed='left').sum()
+                .reset_index())
+    return chart_df, label
+
+
+def _scatter_class(points):
+    """점 개수에 따라 Scatter(SVG) / Scattergl(WebGL) 선택"""
+    return go.Scattergl if points > SCATTERGL_THRESHOLD else go.Scatter
+
+
+def build_ai_figure(api_df):
+    """마켓터빌리티 차트 (API 사용 건수 / 토큰 사용량 / 비용)"""
+    chart_df_ai, resolution = downsample(api_df)
+
+    fig = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=('API 사용 & 토큰 사용량', 'API Cost($)'),
+        vertical_spacing=0.15,
+        row_heights=[1, 1]
+    )
+
+    # API Calls 바 차트
+    fig.add_trace(
+        go.Bar(
+            x=chart_df_ai['Date'],
+            y=chart_df_ai['API Calls'],
+            name='API 사용',
+            marker_color='#10B981',
+            opacity=0.8
+        ),
+        row=1, col=1
+    )
+
+    # Tokens 라인
+    fig.add_trace(
+        _scatter_class(len(chart_df_ai))(
+            x=chart_df_ai['Date'],
+            y=chart_df_ai['Total Tokens'],
+            name='토큰 사용량',
+            mode='lines+markers',
+            line=dict(color='#3A7BFF', width=3),
+            marker=dict(size=8, color='#3A7BFF'),
+            yaxis='y2'
+        ),
+        row=1, col=1
+    )
+
+    # Cost 바 차트
+    fig.add_trace(
+        go.Bar(
+            x=chart_df_ai['Date'],
+            y=chart_df_ai['Cost ($)'],
+            name='Cost($)',
+            marker_color='#FF6B6B',
+            opacity=0.8
+        ),
+        row=2, col=1
+    )
+
+    fig.update_layout(
+        height=600,
+        showlegend=True,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family="Arial", size=12),
+        hovermode='x unified'
+    )
+
+    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.1)', row=1, col=1)
+    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.1)', title_text=f'Date ({resolution} 단위)', row=2, col=1)
+    fig.update_yaxes(title_text="API 사용 건수", showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.1)', row=1, col=1)
+    fig.update_yaxes(title_text="API 사용 비용 ($)", showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.1)', row=2, col=1)
+    fig.update_yaxes(title_text="토큰 사용량", overlaying='y', side='right', row=1, col=1)
+
+    return fig
+
+
+def build_model_figure(model_df):
+    """모델생성 차트 (모델 생성 / 정형화 / 비정형화)"""
+    chart_df_model, resolution = downsample(model_df)
+
+    fig = go.Figure()
+
+    # Total Count 바 차트
+    fig.add_trace(go.Bar(
+        x=chart_df_model['Date'],
+        y=chart_df_model['Total Count'],
+        name='모델 생성',
+        marker_color='#3A7BFF',
+        opacity=0.8
+    ))
+
+    # Standardized 바 차트
+    fig.add_trace(go.Bar(
+        x=chart_df_model['Date'],
+        y=chart_df_model['Standardized'],
+        name='정형화',
+        marker_color='#10B981',
+        opacity=0.8
+    ))
+
+    # Non-Standardized 바 차트
+    fig.add_trace(go.Bar(
+        x=chart_df_model['Date'],
+        y=chart_df_model['Non-Standardized'],
+        name='비정형화',
+        marker_color='#F59E0B',
+        opacity=0.8
+    ))
+
+    fig.update_layout(
+        title='모델 생성 건수 추이',
+        xaxis_title=f'Date ({resolution} 단위)',
+        yaxis_title='건수',
+        height=500,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family="Arial", size=10),
+        hovermode='x unified',
+        showlegend=True,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        barmode='group'
+    )
+
+    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.1)')
+    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.1)')
+
+    return fig
+
+
+def build_photo_figure(photo_upload_df):
+    """이미지 업로드 차트 (이미지 업로드 / SG NO / Web Open)"""
+    chart_df_photo, resolution = downsample(photo_upload_df)
+
+    fig = go.Figure()
+
+    # Total Count 바 차트
+    fig.add_trace(go.Bar(
+        x=chart_df_photo['Date'],
+        y=chart_df_photo['Total Count'],
+        name='이미지 업로드',
+        marker_color='#3A7BFF',
+        opacity=0.8
+    ))
+
+    # Total sgno 바 차트
+    fig.add_trace(go.Bar(
+        x=chart_df_photo['Date'],
+        y=chart_df_photo['Total sgno'],
+        name='상품 수량(SG NO)',
+        marker_color='#10B981',
+        opacity=0.8
+    ))
+
+    # Web Open Chk 바 차트
+    fig.add_trace(go.Bar(
+        x=chart_df_photo['Date'],
+        y=chart_df_photo['Total Web Open Chk'],
+        name='Web Open',
+        marker_color='#EC4899',
+        opacity=0.8
+    ))
+
+    fig.update_layout(
+        title='이미지 업로드 건수 추이',
+        xaxis_title=f'Date ({resolution} 단위)',
+        yaxis_title='건수',
+        height=500,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family="Arial", size=12),
+        hovermode='x unified',
+        showlegend=True,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        barmode='group'
+    )
+
+    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.1)')
+    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='rgba(0,0,0,0.1)')
+
+    return fig
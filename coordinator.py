@@ -0,0 +1,130 @@
+"""
+워커 간 새로고침 조정
+같은 서버에서 여러 Streamlit 워커(프로세스)가 스냅샷 디렉터리를 공유할 때,
+파일 잠금으로 한 번에 한 워커만 DB를 조회하고 결과 스냅샷을 저장하게 한다.
+저장한 워커는 버전 표시 파일(generation)을 올리고, 다른 워커는 이 값만 확인해서
+더 새 스냅샷이 있으면 DB 조회 없이 디스크에서 다시 읽는다.
+새로고침 중인 워커는 시작 시각을 잠금 파일에 적어 두므로, 그동안 들어온 새로고침 요청은
+DB를 다시 조회하지 않고 진행 중인 새로고침 결과를 기다려서 사용한다.
+
+잠금은 fcntl.flock이므로 프로세스가 죽으면 자동으로 풀린다 (POSIX 전용).
+"""
+import fcntl
+import json
+import logging
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+
+LOCK_FILE = "refresh.lock"
+STAMP_FILE = "version.json"
+
+# 다른 워커의 새로고침을 기다리는 최대 시간(초). 넘으면 잠금 없이 직접 조회하되 스냅샷은 읽거나 쓰지 않음
+LOCK_TIMEOUT = 120
+# 백그라운드 스레드가 버전 표시를 확인하는 주기(초)
+SYNC_INTERVAL = 5
+
+logger = logging.getLogger("dashboard.coordinator")
+
+
+class RefreshCoordinator:
+    """스냅샷 디렉터리 하나를 공유하는 워커들의 잠금과 버전 표시"""
+
+    def __init__(self, directory, lock_timeout=LOCK_TIMEOUT, sync_interval=SYNC_INTERVAL):
+        self.directory = Path(directory)
+        self.lock_timeout = lock_timeout
+        self.sync_interval = sync_interval
+
+    @contextmanager
+    def locked(self):
+        """워커 간 배타 잠금 (with 구문)
+
+        lock_timeout 안에 잡지 못하면 (다른 워커가 멈춘 경우 등) 경고를 남기고 잠금 없이 진행한다.
+        이때 호출하는 쪽은 공유 스냅샷을 읽거나 쓰지 않아야 한다.
+        잠금을 풀 때 잠금 파일에 적힌 새로고침 시작 시각을 지운다.
+
+        Yields:
+            잠금을 잡았는지 여부
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.directory / LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            acquired = self._acquire(fd)
+            if not acquired:
+                logger.warning("refresh lock not acquired within %ss, continuing without it", self.lock_timeout)
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    os.ftruncate(fd, 0)
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def _acquire(self, fd):
+        deadline = time.monotonic() + self.lock_timeout
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return True
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(0.1)
+
+    def mark_refreshing(self, started_at):
+        """새로고침 시작 시각을 잠금 파일에 기록 (잠금을 잡은 상태에서 호출, 잠금을 풀면 지워짐)"""
+        (self.directory / LOCK_FILE).write_text(started_at.isoformat(), encoding="utf-8")
+
+    def refreshing_since(self):
+        """지금 잠금을 잡고 진행 중인 새로고침의 시작 시각. 진행 중인 새로고침이 없으면 None
+
+        잠금이 풀려 있으면 (이전 워커가 죽으면서 남긴 내용이 있어도) None이다.
+        """
+        try:
+            fd = os.open(self.directory / LOCK_FILE, os.O_RDONLY)
+        except OSError:
+            return None
+        try:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+            except BlockingIOError:
+                content = os.read(fd, 64).decode("utf-8", "replace").strip()
+                try:
+                    return datetime.fromisoformat(content) if content else None
+                except ValueError:
+                    return None
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            return None
+        finally:
+            os.close(fd)
+
+    def read_stamp(self):
+        """마지막으로 저장된 스냅샷의 버전 표시. 없거나 읽을 수 없으면 None
+
+        Returns:
+            {'generation', 'refreshed_at', 'pid'}
+        """
+        try:
+            stamp = json.loads((self.directory / STAMP_FILE).read_text(encoding="utf-8"))
+            stamp['refreshed_at'] = datetime.fromisoformat(stamp['refreshed_at'])
+            return stamp
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def generation(self):
+        """공유 스냅샷 generation (없으면 0)"""
+        stamp = self.read_stamp()
+        return stamp['generation'] if stamp is not None else 0
+
+    def write_stamp(self, generation, refreshed_at):
+        """스냅샷 저장이 끝난 뒤 버전 표시 교체 (잠금을 잡은 상태에서 호출)"""
+        path = self.directory / STAMP_FILE
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+        stamp = {'generation': generation, 'refreshed_at': refreshed_at.isoformat(), 'pid': os.getpid()}
+        tmp_path.write_text(json.dumps(stamp), encoding="utf-8")
+        os.replace(tmp_path, path)
@@ -0,0 +1,81 @@
+"""
+MySQL 연결 풀
+프로세스 단위로 하나의 연결 풀을 만들어 두고 모든 대시보드 쿼리가 빌려 쓴다.
+"""
+import time
+from contextlib import contextmanager
+from functools import partial
+
+import streamlit as st
+from mysql.connector import errors, pooling
+
+
+DEFAULT_POOL_SIZE = 5
+DEFAULT_POOL_TIMEOUT = 10    # 풀이 모두 사용 중일 때 대기할 최대 시간(초)
+
+
+def get_db_config():
+    """Streamlit secrets에서 데이터베이스 연결 정보 가져오기"""
+    return {
+        "host": st.secrets["db"]["host"],
+        "user": st.secrets["db"]["user"],
+        "password": st.secrets["db"]["password"],
+        "database": st.secrets["db"]["database"],
+        "port": st.secrets["db"]["port"]
+    }
+
+
+@st.cache_resource
+def get_pool():
+    """프로세스 공용 연결 풀 (pool_size는 st.secrets["db"]["pool_size"])"""
+    pool_size = int(st.secrets["db"].get("pool_size", DEFAULT_POOL_SIZE))
+    return pooling.MySQLConnectionPool(
+        pool_name="dashboard",
+        pool_size=pool_size,
+        pool_reset_session=True,
+        **get_db_config()
+    )
+
+
+def _borrow(pool, timeout):
+    """풀에서 연결을 빌림. 남은 연결이 없으면 timeout 동안 재시도"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return pool.get_connection()
+        except errors.PoolError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.1)
+
+
+@contextmanager
+def pooled_connection(pool, timeout=DEFAULT_POOL_TIMEOUT):
+    """풀에서 연결을 빌려서 사용 후 반납
+
+    빌려온 연결은 ping으로 상태를 확인하고, 끊어진(stale) 연결은 재연결한다.
+    Streamlit API를 호출하지 않으므로 작업 스레드에서도 사용할 수 있다.
+    """
+    conn = _borrow(pool, timeout)
+    try:
+        conn.ping(reconnect=True, attempts=3, delay=1)
+        yield conn
+    finally:
+        # 풀 연결의 close()는 실제로 끊지 않고 풀에 반납
+        conn.close()
+
+
+def connection_factory():
+    """공용 풀에 묶인 연결 함수 반환 (스크립트 스레드에서 호출)
+
+        connect = connection_factory()
+        with connect() as conn:
+            df = pd.read_sql_query(sql, conn)
+    """
+    timeout = float(st.secrets["db"].get("pool_timeout", DEFAULT_POOL_TIMEOUT))
+    return partial(pooled_connection, get_pool(), timeout)
+
+
+def get_connection():
+    """공용 풀에서 연결 하나를 빌림 (with 구문으로 사용)"""
+    return connection_factory()()
@@ -0,0 +1,94 @@
+"""
+일자별 집계 엔진
+원본 행 묶음(chunk)을 일자별 집계로 바꾸는 계산을 엔진 객체 뒤에 둔다.
+[dashboard] engine 설정으로 고르며, 스트리밍 적재(ingest_mode = "stream")가 chunk마다 사용한다.
+
+    pandas: groupby 벡터 연산 (ingest.aggregate_chunk)
+    duckdb: chunk를 Arrow 테이블로 넘겨 DuckDB에서 GROUP BY (벡터화 + 멀티스레드, pip install duckdb)
+
+두 엔진은 같은 입력에 대해 같은 결과(컬럼, dtype, 정렬된 date 인덱스)를 반환한다.
+"""
+import threading
+
+import pandas as pd
+import pyarrow as pa
+
+from ingest import aggregate_chunk
+from schema import DAILY_SCHEMAS
+
+
+ENGINES = ('pandas', 'duckdb')
+DEFAULT_ENGINE = 'pandas'
+
+# pandas groupby와 결과를 맞추기 위해 date가 없는 행은 제외하고, 값이 모두 NULL인 합계는 0으로
+# (합계는 HUGEINT라 BIGINT로 맞춰야 pandas 변환 시 float가 되지 않음)
+DUCKDB_SQL = {
+    'ai_response': """
+        SELECT date_trunc('day', "date") AS "date",
+               CAST(COALESCE(SUM("token"), 0) AS BIGINT) AS token_sum, COUNT("token") AS "count"
+        FROM chunk WHERE "date" IS NOT NULL GROUP BY 1 ORDER BY 1
+    """,
+    'model_create': """
+        SELECT date_trunc('day', "date") AS "date",
+               COUNT("model_id") AS total_count, COUNT(*) FILTER (WHERE "{standard_col}" = 1) AS standardized
+        FROM chunk WHERE "date" IS NOT NULL GROUP BY 1 ORDER BY 1
+    """,
+    'photo_upload': """
+        SELECT date_trunc('day', "date") AS "date",
+               CAST(COALESCE(SUM("count"), 0) AS BIGINT) AS count_sum, COUNT("sgno") AS sgno_count,
+               CAST(COALESCE(SUM("web_open_chk"), 0) AS BIGINT) AS web_open_chk
+        FROM chunk WHERE "date" IS NOT NULL GROUP BY 1 ORDER BY 1
+    """,
+}
+
+
+class PandasEngine:
+    """pandas groupby 엔진 (기본값, 추가 의존성 없음)"""
+
+    name = 'pandas'
+
+    def aggregate(self, table, chunk, standard_col='standard_status'):
+        return aggregate_chunk(table, chunk, standard_col)
+
+
+class DuckDBEngine:
+    """DuckDB-over-Arrow 엔진
+
+    프로세스당 인메모리 DuckDB 데이터베이스 하나를 두고, 호출마다 cursor(같은 DB의 별도 연결)를
+    열어서 쓰므로 여러 스레드에서 동시에 호출할 수 있다. threads를 지정하지 않으면 DuckDB가
+    코어 수만큼 스레드를 사용한다.
+    """
+
+    name = 'duckdb'
+
+    def __init__(self, threads=None):
+        try:
+            import duckdb
+        except ImportError as e:
+            raise RuntimeError("engine = \"duckdb\" requires the duckdb package (pip install duckdb)") from e
+        self.lock = threading.Lock()
+        self.conn = duckdb.connect(':memory:')
+        if threads:
+            self.conn.execute(f"SET threads = {int(threads)}")
+
+    def aggregate(self, table, chunk, standard_col='standard_status'):
+        arrow_chunk = pa.Table.from_pandas(chunk, preserve_index=False)
+        with self.lock:
+            cursor = self.conn.cursor()
+        try:
+            cursor.register('chunk', arrow_chunk)
+            grouped = cursor.execute(DUCKDB_SQL[table].format(standard_col=standard_col)).df()
+        finally:
+            cursor.close()
+        grouped = grouped.set_index('date')
+        grouped.index = pd.DatetimeIndex(grouped.index, name='date').astype(chunk['date'].dtype)
+        return grouped[list(DAILY_SCHEMAS[table])].astype('int64')
+
+
+def create_engine(name=DEFAULT_ENGINE, threads=None):
+    """설정 이름으로 집계 엔진 생성"""
+    if name == 'pandas':
+        return PandasEngine()
+    if name == 'duckdb':
+        return DuckDBEngine(threads)
+    raise ValueError(f"unknown engine {name!r} (expected one of {ENGINES})")
@@ -0,0 +1,256 @@
+"""
+헤드리스 집계 내보내기
+대시보드 화면 없이 기간 보고서(daily/weekly/monthly)와 일자별 표(API/모델/사진)를
+JSON, CSV, Arrow로 내보낸다. 대시보드와 같은 스냅샷 디렉터리에서 복원하고
+같은 증분 새로고침/기간별 결과 캐시를 사용하므로 이미 적재된 기간은 DB 조회 없이 반환한다.
+
+    python export.py report --start 2025-01-01 --end 2025-01-31
+    python export.py report --format csv --table model --output model.csv
+    python export.py serve --port 8502
+
+HTTP (serve)
+    GET /report?start=2025-01-01&end=2025-01-31&format=json
+    GET /report?format=csv&table=photo
+    GET /health
+
+DB 연결 정보와 [dashboard] 설정은 대시보드와 같은 .streamlit/secrets.toml에서 읽는다.
+"""
+import argparse
+import io
+import json
+import logging
+import sys
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import pyarrow as pa
+import streamlit as st
+
+from aggregates import build_range_tables
+from db import connection_factory
+from memo import DEFAULT_MEMO_SIZE, RangeMemo
+from rollup import calculate_period_stats
+from snapshot import encode_json
+from store import REFRESH_INTERVAL, create_store, enable_copy_on_write
+
+
+BASE_DIR = Path(__file__).parent
+
+FORMATS = ('json', 'csv', 'arrow')
+TABLES = ('periods', 'api', 'model', 'photo')     # csv/arrow는 표 하나씩
+PERIODS = (('daily', 1), ('weekly', 7), ('monthly', 30))
+DEFAULT_RANGE_DAYS = 30
+
+logger = logging.getLogger("dashboard.export")
+
+# 내보내는 표의 고정 스키마. 저장소 프레임은 메모리 절약을 위해 int8/int32 등으로 줄여 두므로
+# 내보낼 때는 항상 int64/float64로 맞추고, 해당 기간에 데이터가 없어도 같은 컬럼을 유지한다.
+EXPORT_SCHEMAS = {
+    'periods': pa.schema([
+        ('period', pa.string()), ('start_date', pa.date32()), ('end_date', pa.date32()),
+        ('marketablity_count', pa.int64()), ('marketablity_tokens', pa.int64()),
+        ('marketablity_cost', pa.float64()), ('model_create_count', pa.int64()),
+        ('sgno_count', pa.int64()), ('images_count', pa.int64()),
+    ]),
+    'api': pa.schema([
+        ('Date', pa.date32()), ('Total Tokens', pa.int64()), ('API Calls', pa.int64()), ('Cost ($)', pa.float64()),
+    ]),
+    'model': pa.schema([
+        ('Date', pa.date32()), ('Total Count', pa.int64()), ('Standardized', pa.int64()),
+        ('Non-Standardized', pa.int64()),
+    ]),
+    'photo': pa.schema([
+        ('Date', pa.date32()), ('Total Count', pa.int64()), ('Total sgno', pa.int64()),
+        ('Total Web Open Chk', pa.int64()),
+    ]),
+}
+
+CONTENT_TYPES = {
+    'json': 'application/json; charset=utf-8',
+    'csv': 'text/csv; charset=utf-8',
+    'arrow': 'application/vnd.apache.arrow.stream',
+}
+
+
+class Exporter:
+    """저장소 + 기간별 결과 캐시로 보고서를 만드는 객체 (프로세스당 하나)"""
+
+    def __init__(self, store, memo):
+        self.store = store
+        self.memo = memo
+
+    @classmethod
+    def from_secrets(cls):
+        """대시보드와 같은 설정(.streamlit/secrets.toml)으로 생성"""
+        config = st.secrets.get("dashboard", {})
+        store = create_store(connection_factory(), config, BASE_DIR)
+        memo = RangeMemo(int(config.get("range_memo_size", DEFAULT_MEMO_SIZE)))
+        return cls(store, memo)
+
+    def report(self, start_date, end_date):
+        """기간 보고서 + start_date ~ end_date 일자별 표
+
+        Returns:
+            {'as_of', 'version', 'start_date', 'end_date', 'periods', 'totals', 'tables'}
+        """
+        report_end_date = datetime.now().date()
+        self.store.ensure_range(min(start_date, report_end_date - timedelta(days=29)),
+                                max(end_date, report_end_date))
+        state = self.store.state
+        tables, _ = self.memo.get(
+            start_date, end_date, state.version,
+            lambda: build_range_tables(state.get_frames(), state.rollup, start_date, end_date)
+        )
+        return {
+            'as_of': state.refreshed_at,
+            'version': state.version,
+            'start_date': start_date,
+            'end_date': end_date,
+            'periods': {name: calculate_period_stats(state.rollup, days) for name, days in PERIODS},
+            'totals': {col: value.item() for col, value in tables['totals'].items()},
+            'tables': {'api': tables['api_df'], 'model': tables['model_df'], 'photo': tables['photo_df']},
+        }
+
+
+def periods_frame(report):
+    """기간 보고서를 표 하나로 (period, start_date, end_date, ...)"""
+    return pd.DataFrame([{'period': name, **stats} for name, stats in report['periods'].items()])
+
+
+def report_table(report, table):
+    """내보낼 표 하나를 EXPORT_SCHEMAS 스키마의 Arrow 테이블로 (빈 기간이면 컬럼만 있는 빈 테이블)"""
+    frame = periods_frame(report) if table == 'periods' else report['tables'][table]
+    schema = EXPORT_SCHEMAS[table]
+    if frame.empty:
+        return schema.empty_table()
+    return pa.Table.from_pandas(frame[schema.names], schema=schema, preserve_index=False).replace_schema_metadata()
+
+
+def _records(report, table):
+    return report_table(report, table).to_pandas().to_dict(orient='records')
+
+
+def render(report, fmt='json', table='api'):
+    """보고서를 fmt 형식 bytes로 변환 (json은 전체, csv/arrow는 table 하나)"""
+    if fmt == 'json':
+        payload = {**report, 'tables': {name: _records(report, name) for name in report['tables']}}
+        return json.dumps(payload, ensure_ascii=False, default=encode_json).encode('utf-8')
+    arrow_table = report_table(report, table)
+    if fmt == 'csv':
+        return arrow_table.to_pandas().to_csv(index=False).encode('utf-8')
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, arrow_table.schema) as writer:
+        writer.write_table(arrow_table)
+    return sink.getvalue()
+
+
+def parse_range(start, end):
+    """YYYY-MM-DD 문자열 기간 (없으면 오늘까지 최근 DEFAULT_RANGE_DAYS일)"""
+    end_date = date.fromisoformat(end) if end else datetime.now().date()
+    start_date = date.fromisoformat(start) if start else end_date - timedelta(days=DEFAULT_RANGE_DAYS - 1)
+    if start_date > end_date:
+        raise ValueError("start must not be after end")
+    return start_date, end_date
+
+
+# ------------------------------
+# HTTP 서버
+# ------------------------------
+def make_handler(exporter):
+    class ExportHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            if url.path == '/health':
+                state = exporter.store.state
+                body = json.dumps({'version': state.version, 'as_of': state.refreshed_at}, default=encode_json)
+                return self._send(200, CONTENT_TYPES['json'], body.encode('utf-8'))
+            if url.path != '/report':
+                return self._error(404, "not found")
+            fmt = query.get('format', 'json')
+            table = query.get('table', 'api')
+            if fmt not in FORMATS or table not in TABLES:
+                return self._error(400, f"format must be one of {FORMATS}, table one of {TABLES}")
+            try:
+                start_date, end_date = parse_range(query.get('start'), query.get('end'))
+            except ValueError as e:
+                return self._error(400, str(e))
+            try:
+                body = render(exporter.report(start_date, end_date), fmt, table)
+            except Exception:
+                # DB/새로고침 오류도 연결을 끊지 않고 500으로 응답 (log_message를 끄므로 여기서 기록)
+                logger.exception("report failed: %s", self.path)
+                return self._error(500, "report failed")
+            self._send(200, CONTENT_TYPES[fmt], body)
+
+        def _error(self, status, message):
+            self._send(status, CONTENT_TYPES['json'], json.dumps({'error': message}).encode('utf-8'))
+
+        def _send(self, status, content_type, body):
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return ExportHandler
+
+
+def serve(exporter, host, port, refresh_interval):
+    """HTTP 서버 실행 (백그라운드 새로고침 포함)"""
+    exporter.store.start_refresher(refresh_interval)
+    server = ThreadingHTTPServer((host, port), make_handler(exporter))
+    print(f"serving on http://{host}:{port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        exporter.store.stop_refresher()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export dashboard aggregates without a UI session")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    report_parser = commands.add_parser('report', help="write one report to stdout or a file")
+    report_parser.add_argument('--start', help="YYYY-MM-DD (default: 29 days before --end)")
+    report_parser.add_argument('--end', help="YYYY-MM-DD (default: today)")
+    report_parser.add_argument('--format', choices=FORMATS, default='json')
+    report_parser.add_argument('--table', choices=TABLES, default='api', help="table for csv/arrow")
+    report_parser.add_argument('--output', type=Path, help="output file (default: stdout)")
+
+    serve_parser = commands.add_parser('serve', help="serve reports over HTTP")
+    serve_parser.add_argument('--host', default='127.0.0.1')
+    serve_parser.add_argument('--port', type=int, default=8502)
+    args = parser.parse_args()
+
+    enable_copy_on_write()
+    exporter = Exporter.from_secrets()
+    refresh_interval = float(st.secrets.get("dashboard", {}).get("refresh_interval", REFRESH_INTERVAL))
+    if args.command == 'serve':
+        serve(exporter, args.host, args.port, refresh_interval)
+        return
+
+    try:
+        start_date, end_date = parse_range(args.start, args.end)
+    except ValueError as e:
+        parser.error(str(e))
+    # 복원한 스냅샷이 refresh_interval보다 오래됐으면 최신 데이터로 갱신한 뒤 답한다
+    exporter.store.refresh(max_age=refresh_interval)
+    body = render(exporter.report(start_date, end_date), args.format, args.table)
+    if args.output:
+        args.output.write_bytes(body)
+    else:
+        sys.stdout.buffer.write(body)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+스트리밍 집계 적재
+원본 행을 서버 측(unbuffered) 커서로 chunksize 단위씩 읽으면서 일자별 집계에
+바로 누적한다. 최대 메모리가 테이블 크기가 아니라 chunksize에 비례하므로
+DB 쪽 GROUP BY를 쓸 수 없거나 부담스러울 때 사용한다.
+"""
+import pandas as pd
+
+from queries import date_bounds
+from schema import DAILY_SCHEMAS, downcast, raw_schema
+
+
+DEFAULT_CHUNK_SIZE = 50000
+
+
+def aggregate_chunk(table, chunk, standard_col='standard_status'):
+    """원본 행 묶음을 일자별 집계로 변환 (컬럼명은 DAILY_SCHEMAS 기준)"""
+    day = chunk['date'].dt.normalize().rename('date')
+    if table == 'ai_response':
+        grouped = chunk.groupby(day).agg(token_sum=('token', 'sum'), count=('token', 'count'))
+    elif table == 'model_create':
+        # 파이썬 lambda 대신 (값 == 1) 불리언 컬럼을 만들어 벡터 연산으로 합산
+        chunk = chunk.assign(standardized=(chunk[standard_col] == 1))
+        grouped = chunk.groupby(day).agg(total_count=('model_id', 'count'),
+                                         standardized=('standardized', 'sum'))
+    else:
+        grouped = chunk.groupby(day).agg(count_sum=('count', 'sum'), sgno_count=('sgno', 'count'),
+                                         web_open_chk=('web_open_chk', 'sum'))
+    return grouped.astype('int64')
+
+
+def stream_daily(conn, table, start_date, end_date, standard_col='standard_status',
+                 chunksize=DEFAULT_CHUNK_SIZE, engine=None):
+    """start_date ~ end_date 원본 행을 chunksize 단위로 읽어 일자별 집계 생성
+
+    engine: chunk 집계 엔진 (engines.create_engine, 없으면 aggregate_chunk)
+
+    Returns:
+        queries.fetch_*_daily와 같은 형태의 일자별 집계 (정렬된 datetime64 date 인덱스)
+    """
+    schema = raw_schema(table, standard_col)
+    column_sql = ", ".join(f"`{col}`" for col in schema)
+    sql = f"SELECT {column_sql} FROM `{table}` WHERE `date` >= %s AND `date` < %s"
+    aggregate = engine.aggregate if engine is not None else aggregate_chunk
+    running = None
+    # buffered=False: 결과를 클라이언트에 한 번에 받지 않고 fetchmany할 때마다 서버에서 읽어옴
+    cursor = conn.cursor(buffered=False)
+    try:
+        cursor.execute(sql, date_bounds(start_date, end_date))
+        columns = [desc[0] for desc in cursor.description]
+        while True:
+            rows = cursor.fetchmany(chunksize)
+            if not rows:
+                break
+            chunk = downcast(pd.DataFrame.from_records(rows, columns=columns), schema)
+            # 누적 집계(일 수 만큼의 행)와 이번 묶음 집계만 합치므로 메모리가 일정하게 유지됨
+            partial = aggregate(table, chunk, standard_col)
+            running = partial if running is None else pd.concat([running, partial]).groupby(level=0).sum()
+    finally:
+        cursor.close()
+    if running is None:
+        running = pd.DataFrame(columns=list(DAILY_SCHEMAS[table]), dtype='int64')
+    running.index = pd.DatetimeIndex(running.index, name='date')
+    return downcast(running.astype('int64'), DAILY_SCHEMAS[table]).sort_index()
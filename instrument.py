@@ -0,0 +1,155 @@
+"""
+단계별 계측
+화면 한 번 그릴 때(rerun) 구간별 소요 시간, 처리 행 수, 캐시 hit/miss를 기록하고
+프로세스 누적값을 구조화 로그(JSON 한 줄) 또는 Prometheus 텍스트 파일로 내보낸다.
+"""
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+
+
+logger = logging.getLogger("dashboard.metrics")
+
+# Prometheus 텍스트 파일을 다시 쓰는 최소 간격(초). rerun마다 쓰지 않고 이 간격마다 한 번만 쓴다
+TEXTFILE_INTERVAL = 5
+
+
+class RunTrace:
+    """rerun 한 번의 단계별 기록
+
+    scope: 실행 단위 이름 (전체 rerun이 아닌 fragment 단독 rerun은 fragment 이름)
+
+        trace = RunTrace("ai_section")
+        with trace.stage("load_data") as record:
+            ...
+            record['rows'] = len(df)
+            record['cache'] = 'hit'
+    """
+
+    def __init__(self, scope="app"):
+        self.scope = scope
+        self.records = []
+        self.started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name, rows=None, cache=None):
+        record = {'stage': name, 'seconds': 0.0, 'rows': rows, 'cache': cache}
+        started = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['seconds'] = time.perf_counter() - started
+            self.records.append(record)
+
+    @property
+    def total_seconds(self):
+        return time.perf_counter() - self.started
+
+    def to_frame(self):
+        """진단 패널 표시용 데이터프레임"""
+        frame = pd.DataFrame(self.records, columns=['stage', 'seconds', 'rows', 'cache'])
+        frame.insert(0, 'scope', self.scope)
+        return frame
+
+    def log_lines(self):
+        """단계별 구조화 로그 (JSON 한 줄씩)"""
+        return [json.dumps({'scope': self.scope, **record}, ensure_ascii=False, default=str)
+                for record in self.records]
+
+
+class StageMetrics:
+    """프로세스 누적 단계 지표 (모든 세션 공용)"""
+
+    def __init__(self, textfile_interval=TEXTFILE_INTERVAL):
+        self.lock = threading.Lock()
+        self.stages = {}
+        self.reruns = {}
+        self.textfile_interval = textfile_interval
+        self.textfile_written = None    # 마지막으로 텍스트 파일을 쓴 시각 (time.monotonic)
+
+    def observe(self, trace):
+        with self.lock:
+            self.reruns[trace.scope] = self.reruns.get(trace.scope, 0) + 1
+            for record in trace.records:
+                stage = self.stages.setdefault(record['stage'], {
+                    'count': 0, 'seconds': 0.0, 'rows': 0, 'cache_hit': 0, 'cache_miss': 0,
+                })
+                stage['count'] += 1
+                stage['seconds'] += record['seconds']
+                stage['rows'] += record['rows'] or 0
+                if record['cache'] in ('hit', 'miss'):
+                    stage['cache_' + record['cache']] += 1
+
+    def to_frame(self):
+        with self.lock:
+            rows = [{'stage': name, **values} for name, values in self.stages.items()]
+        return pd.DataFrame(rows, columns=['stage', 'count', 'seconds', 'rows', 'cache_hit', 'cache_miss'])
+
+    def prometheus_text(self):
+        """Prometheus 텍스트 형식 (node_exporter textfile collector 등에서 수집)"""
+        with self.lock:
+            lines = [
+                "# HELP dashboard_reruns_total Script or fragment reruns observed.",
+                "# TYPE dashboard_reruns_total counter",
+            ]
+            for scope, count in self.reruns.items():
+                lines.append(f'dashboard_reruns_total{{scope="{scope}"}} {count}')
+            metrics = [
+                ('dashboard_stage_runs_total', 'count', 'Times the stage ran.'),
+                ('dashboard_stage_seconds_total', 'seconds', 'Wall time spent in the stage.'),
+                ('dashboard_stage_rows_total', 'rows', 'Rows processed by the stage.'),
+                ('dashboard_stage_cache_hits_total', 'cache_hit', 'Cache hits in the stage.'),
+                ('dashboard_stage_cache_misses_total', 'cache_miss', 'Cache misses in the stage.'),
+            ]
+            for metric, key, help_text in metrics:
+                lines.append(f"# HELP {metric} {help_text}")
+                lines.append(f"# TYPE {metric} counter")
+                for name, values in self.stages.items():
+                    lines.append(f'{metric}{{stage="{name}"}} {values[key]}')
+        return "\n".join(lines) + "\n"
+
+    def textfile_due(self):
+        """텍스트 파일을 쓸 차례인지 (textfile_interval초마다 한 번, 여러 세션 중 한 스레드만 True)"""
+        now = time.monotonic()
+        with self.lock:
+            if self.textfile_written is not None and now - self.textfile_written < self.textfile_interval:
+                return False
+            self.textfile_written = now
+            return True
+
+    def write_textfile(self, path):
+        """Prometheus 텍스트 파일 저장 (수집기가 반쯤 쓰인 파일을 읽지 않도록 교체 방식)
+
+        임시 파일 이름에 pid와 uuid를 붙여서 여러 스레드가 동시에 써도 서로의 임시 파일을 덮어쓰지 않는다.
+        """
+        path = Path(path)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_path.write_text(self.prometheus_text(), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+
+def export_trace(trace, metrics, log=False, textfile=None):
+    """rerun 기록을 누적 지표에 반영하고 설정에 따라 로그/텍스트 파일로 내보냄
+
+    텍스트 파일은 rerun마다 쓰지 않고 metrics.textfile_interval초마다 한 번만 다시 쓴다.
+    """
+    metrics.observe(trace)
+    if log:
+        for line in trace.log_lines():
+            logger.info(line)
+    if textfile and metrics.textfile_due():
+        try:
+            metrics.write_textfile(textfile)
+        except OSError:
+            logger.warning("failed to write metrics textfile %s", textfile)
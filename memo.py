@@ -0,0 +1,64 @@
+"""
+기간별 결과 메모이제이션
+(start_date, end_date, data_version)을 키로 완성된 기간별 표와 합계를 LRU로 보관해서
+같은 기간을 다시 선택하면 (다른 세션이라도) pandas 작업 없이 바로 반환한다.
+"""
+import threading
+from collections import OrderedDict
+
+
+DEFAULT_MEMO_SIZE = 32
+
+
+class RangeMemo:
+    """프로세스 공용 기간별 결과 LRU 캐시
+
+    데이터 버전이 키에 포함되므로 새로고침 후에는 자동으로 새로 계산되며,
+    새 버전이 처음 들어올 때 이전 버전 항목은 한꺼번에 비운다.
+    """
+
+    def __init__(self, maxsize=DEFAULT_MEMO_SIZE):
+        self.maxsize = maxsize
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, start_date, end_date, version, build):
+        """캐시된 결과 또는 build()로 새로 만든 결과
+
+        Returns:
+            (value, hit)
+        """
+        key = (start_date, end_date, version)
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key], True
+            self.misses += 1
+        # 계산은 잠금 밖에서 (같은 키를 동시에 계산해도 결과는 같음)
+        value = build()
+        with self.lock:
+            if version != self.version:
+                if self.version is not None and version < self.version:
+                    return value, False     # 계산 중에 새로고침됨: 이전 버전은 저장하지 않음
+                self.entries.clear()
+                self.version = version
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        return value, False
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.version = None
+
+    def stats(self):
+        """진단 패널 표시용 (hits, misses, size, maxsize)"""
+        with self.lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'size': len(self.entries), 'maxsize': self.maxsize}
@@ -0,0 +1,242 @@
+"""
+DB 마이그레이션 / 일자별 요약 테이블 재집계
+대시보드 집계 쿼리용 date 커버링 인덱스와 일자별 요약 테이블을 만들고,
+원본 테이블에서 요약 테이블을 다시 집계(upsert)한다. 모든 작업은 여러 번 실행해도 결과가 같다.
+
+    python migrations.py migrate          # 인덱스 + 요약 테이블 생성
+    python migrations.py rebuild          # 마지막 확정일 - late_arrival_days 이후만 재집계 (처음이면 전체)
+    python migrations.py rebuild --full   # 전체 재집계
+    python migrations.py status
+
+rebuild는 cron 등으로 주기적으로 실행한다. 대시보드는 summary_state.rebuilt_until까지는
+요약 테이블에서, 그 이후(당일 등)는 원본 테이블에서 읽는다 (queries.read_daily).
+photo_upload 커버링 인덱스에 sgno가 포함되므로 sgno는 VARCHAR여야 한다.
+"""
+import argparse
+from datetime import date, datetime, timedelta
+
+import mysql.connector
+import streamlit as st
+
+from db import get_db_config
+from queries import (AI_DAILY_SQL, MODEL_DAILY_SQL, PHOTO_DAILY_SQL, SUMMARY_STATE_TABLE, SUMMARY_TABLES,
+                     date_bounds, get_standard_column, get_summary_until)
+from store import LATE_ARRIVAL_DAYS, TABLES
+
+
+# ------------------------------
+# 스키마
+# ------------------------------
+# 집계 쿼리가 원본 행을 읽지 않고 인덱스만으로 끝나도록 (date, 집계 컬럼) 순서로 구성
+# InnoDB 보조 인덱스 끝에는 PK(id)가 붙으므로 drill-down keyset 조회도 하루치 date 범위를 이 인덱스로 읽는다.
+# 단 date가 DATETIME이라 범위 안에서 id 순서가 아니므로, ORDER BY id는 그 하루치 행에 대한 filesort가 된다
+# (비용은 페이지 번호가 아니라 하루치 행 수에 비례).
+COVERING_INDEXES = [
+    ('ai_response', 'ix_ai_response_date_cover', ['date', 'token']),
+    ('model_create', 'ix_model_create_date_cover', ['date', 'model_id', '{standard_col}']),
+    ('photo_upload', 'ix_photo_upload_date_cover', ['date', 'count', 'web_open_chk', 'sgno']),
+]
+
+SUMMARY_TABLE_SQL = [
+    """
+    CREATE TABLE IF NOT EXISTS `daily_ai_usage` (
+        `date` DATE NOT NULL PRIMARY KEY,
+        `token_sum` BIGINT NOT NULL DEFAULT 0,
+        `count` BIGINT NOT NULL DEFAULT 0,
+        `updated_at` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS `daily_model_create` (
+        `date` DATE NOT NULL PRIMARY KEY,
+        `total_count` BIGINT NOT NULL DEFAULT 0,
+        `standardized` BIGINT NOT NULL DEFAULT 0,
+        `updated_at` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS `daily_photo_upload` (
+        `date` DATE NOT NULL PRIMARY KEY,
+        `count_sum` BIGINT NOT NULL DEFAULT 0,
+        `sgno_count` BIGINT NOT NULL DEFAULT 0,
+        `web_open_chk` BIGINT NOT NULL DEFAULT 0,
+        `updated_at` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+    )
+    """,
+    f"""
+    CREATE TABLE IF NOT EXISTS `{SUMMARY_STATE_TABLE}` (
+        `table_name` VARCHAR(64) NOT NULL PRIMARY KEY,
+        `rebuilt_until` DATE NULL,
+        `rebuilt_at` DATETIME NOT NULL
+    )
+    """,
+]
+
+# 원본 집계 쿼리(queries.py)를 그대로 SELECT 부분으로 사용
+UPSERT_SQL = {
+    'ai_response': (
+        "INSERT INTO `daily_ai_usage` (`date`, `token_sum`, `count`)" + AI_DAILY_SQL +
+        "ON DUPLICATE KEY UPDATE `token_sum` = VALUES(`token_sum`), `count` = VALUES(`count`)"
+    ),
+    'model_create': (
+        "INSERT INTO `daily_model_create` (`date`, `total_count`, `standardized`)" + MODEL_DAILY_SQL +
+        "ON DUPLICATE KEY UPDATE `total_count` = VALUES(`total_count`), `standardized` = VALUES(`standardized`)"
+    ),
+    'photo_upload': (
+        "INSERT INTO `daily_photo_upload` (`date`, `count_sum`, `sgno_count`, `web_open_chk`)" + PHOTO_DAILY_SQL +
+        "ON DUPLICATE KEY UPDATE `count_sum` = VALUES(`count_sum`), `sgno_count` = VALUES(`sgno_count`), "
+        "`web_open_chk` = VALUES(`web_open_chk`)"
+    ),
+}
+
+# 재집계 범위 안에서 원본 행이 모두 삭제된 날짜의 요약 행 제거
+DELETE_EMPTY_DAYS_SQL = """
+    DELETE FROM `{summary}`
+    WHERE `date` >= %s AND `date` < %s
+      AND NOT EXISTS (
+          SELECT 1 FROM `{table}` AS raw
+          WHERE raw.`date` >= `{summary}`.`date` AND raw.`date` < `{summary}`.`date` + INTERVAL 1 DAY
+      )
+"""
+
+
+def _index_exists(cursor, table, index):
+    cursor.execute(
+        "SELECT 1 FROM information_schema.statistics "
+        "WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s LIMIT 1",
+        (table, index)
+    )
+    return cursor.fetchone() is not None
+
+
+def migrate(conn):
+    """커버링 인덱스와 요약 테이블 생성 (이미 있으면 건너뜀)
+
+    Returns:
+        새로 만든 인덱스 이름 목록
+    """
+    standard_col = get_standard_column(conn)
+    created = []
+    cursor = conn.cursor()
+    try:
+        for table, index, columns in COVERING_INDEXES:
+            if _index_exists(cursor, table, index):
+                continue
+            column_sql = ", ".join(f"`{col.format(standard_col=standard_col)}`" for col in columns)
+            cursor.execute(f"CREATE INDEX `{index}` ON `{table}` ({column_sql})")
+            created.append(index)
+        for sql in SUMMARY_TABLE_SQL:
+            cursor.execute(sql)
+        conn.commit()
+    finally:
+        cursor.close()
+    return created
+
+
+# ------------------------------
+# 요약 테이블 재집계
+# ------------------------------
+def _earliest_date(cursor, table):
+    cursor.execute(f"SELECT MIN(`date`) FROM `{table}`")
+    value = cursor.fetchone()[0]
+    return value.date() if isinstance(value, datetime) else value
+
+
+def rebuild_table(conn, table, start_date, end_date, standard_col=None):
+    """원본 table의 start_date ~ end_date(포함) 일자별 집계를 요약 테이블에 upsert
+
+    요약이 빈틈없이 확정된 마지막 날짜(summary_state.rebuilt_until)는 이번 범위가
+    기존 확정 구간(또는 원본의 첫 날짜)과 이어질 때만 min(end_date, 어제)로 옮긴다.
+    당일은 계속 행이 쌓이므로 확정하지 않고 대시보드가 원본에서 읽는다.
+    """
+    summary = SUMMARY_TABLES[table]
+    current_until = get_summary_until(conn, table)
+    cursor = conn.cursor()
+    try:
+        earliest = _earliest_date(cursor, table)
+        sql = UPSERT_SQL[table]
+        if table == 'model_create':
+            sql = sql.format(standard_col=standard_col or get_standard_column(conn))
+        cursor.execute(DELETE_EMPTY_DAYS_SQL.format(summary=summary, table=table), date_bounds(start_date, end_date))
+        cursor.execute(sql, date_bounds(start_date, end_date))
+
+        contiguous = (start_date <= current_until + timedelta(days=1) if current_until is not None
+                      else earliest is None or start_date <= earliest)
+        rebuilt_until = current_until
+        if contiguous:
+            rebuilt_until = max(filter(None, [current_until, min(end_date, date.today() - timedelta(days=1))]))
+        cursor.execute(
+            f"INSERT INTO `{SUMMARY_STATE_TABLE}` (`table_name`, `rebuilt_until`, `rebuilt_at`) VALUES (%s, %s, %s) "
+            "ON DUPLICATE KEY UPDATE `rebuilt_until` = VALUES(`rebuilt_until`), `rebuilt_at` = VALUES(`rebuilt_at`)",
+            (summary, rebuilt_until, datetime.now())
+        )
+        conn.commit()
+    finally:
+        cursor.close()
+    return rebuilt_until
+
+
+def rebuild(conn, full=False, late_days=LATE_ARRIVAL_DAYS):
+    """요약 테이블 재집계
+
+    full이 아니면 테이블별 마지막 확정일 - late_days 이후만 다시 집계한다
+    (확정일이 없으면 원본의 첫 날짜부터 전체).
+
+    Returns:
+        {요약 테이블: (재집계 시작일, 확정일)}
+    """
+    standard_col = get_standard_column(conn)
+    today = date.today()
+    results = {}
+    for table in TABLES:
+        until = None if full else get_summary_until(conn, table)
+        if until is not None:
+            start_date = until - timedelta(days=late_days)
+        else:
+            cursor = conn.cursor()
+            try:
+                start_date = _earliest_date(cursor, table) or today
+            finally:
+                cursor.close()
+        rebuilt_until = rebuild_table(conn, table, start_date, today, standard_col)
+        results[SUMMARY_TABLES[table]] = (start_date, rebuilt_until)
+    return results
+
+
+def status(conn):
+    """요약 테이블별 확정일 / 마지막 재집계 시각"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"SELECT `table_name`, `rebuilt_until`, `rebuilt_at` FROM `{SUMMARY_STATE_TABLE}`")
+        return {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+    finally:
+        cursor.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dashboard schema migrations and daily summary rebuilds")
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('migrate', help="create covering indexes and summary tables")
+    rebuild_parser = commands.add_parser('rebuild', help="re-aggregate summary tables from raw tables")
+    rebuild_parser.add_argument('--full', action='store_true', help="rebuild every day instead of the recent window")
+    commands.add_parser('status', help="show summary table state")
+    args = parser.parse_args()
+
+    late_days = int(st.secrets.get("dashboard", {}).get("late_arrival_days", LATE_ARRIVAL_DAYS))
+    conn = mysql.connector.connect(**get_db_config())
+    try:
+        if args.command == 'migrate':
+            created = migrate(conn)
+            print("created indexes: " + (", ".join(created) if created else "none"))
+        elif args.command == 'rebuild':
+            for summary, (start_date, rebuilt_until) in rebuild(conn, args.full, late_days).items():
+                print(f"{summary}: rebuilt from {start_date}, final through {rebuilt_until}")
+        else:
+            for summary, (rebuilt_until, rebuilt_at) in status(conn).items():
+                print(f"{summary}: final through {rebuilt_until} (rebuilt at {rebuilt_at})")
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
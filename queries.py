@@ -0,0 +1,225 @@
+"""
+대시보드 쿼리 레이어
+날짜 범위 조건과 GROUP BY date 집계를 MySQL 쪽에서 처리하여
+일자별 집계 결과만 가져온다. 원본 행은 화면에서 실제로 필요할 때만 조회한다.
+"""
+import sqlite3
+from datetime import date, timedelta
+
+import pandas as pd
+from mysql.connector import errorcode, errors
+
+from schema import DAILY_SCHEMAS, downcast, raw_schema
+
+
+# ------------------------------
+# 일자별 집계 쿼리
+# ------------------------------
+# 범위 조건은 `date` 컬럼을 그대로 비교해야 인덱스를 탈 수 있으므로
+# 종료일은 다음날 0시 미만(<)으로 비교한다.
+AI_DAILY_SQL = """
+    SELECT DATE(`date`) AS date,
+           COALESCE(SUM(token), 0) AS token_sum,
+           COUNT(token) AS count
+    FROM `ai_response`
+    WHERE `date` >= %s AND `date` < %s
+    GROUP BY DATE(`date`)
+"""
+
+MODEL_DAILY_SQL = """
+    SELECT DATE(`date`) AS date,
+           COUNT(model_id) AS total_count,
+           COALESCE(SUM(CASE WHEN `{standard_col}` = 1 THEN 1 ELSE 0 END), 0) AS standardized
+    FROM `model_create`
+    WHERE `date` >= %s AND `date` < %s
+    GROUP BY DATE(`date`)
+"""
+
+PHOTO_DAILY_SQL = """
+    SELECT DATE(`date`) AS date,
+           COALESCE(SUM(`count`), 0) AS count_sum,
+           COUNT(sgno) AS sgno_count,
+           COALESCE(SUM(web_open_chk), 0) AS web_open_chk
+    FROM `photo_upload`
+    WHERE `date` >= %s AND `date` < %s
+    GROUP BY DATE(`date`)
+"""
+
+
+def date_bounds(start_date, end_date):
+    """start_date ~ end_date(포함) 범위를 [start, end + 1일) 파라미터로 변환"""
+    return (start_date, end_date + timedelta(days=1))
+
+
+def _read_daily(conn, sql, start_date, end_date, table):
+    """집계 쿼리를 실행하고 정렬된 datetime64 date 인덱스의 일자별 데이터프레임으로 정리"""
+    df = pd.read_sql_query(sql, conn, params=date_bounds(start_date, end_date))
+    # datetime.date(object) 대신 datetime64로 유지해야 정렬된 인덱스에서 이진 탐색이 가능
+    df['date'] = pd.to_datetime(df['date'])
+    # MySQL SUM() 결과는 Decimal로 넘어오므로 정수형으로 변환 후 값 범위에 맞춰 축소
+    schema = DAILY_SCHEMAS[table]
+    df[list(schema)] = df[list(schema)].astype('int64')
+    return downcast(df, schema).set_index('date').sort_index()
+
+
+def get_table_columns(conn, table):
+    """테이블 컬럼 목록 조회 (행은 가져오지 않음)"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"SELECT * FROM `{table}` LIMIT 0")
+        columns = [desc[0] for desc in cursor.description]
+        cursor.fetchall()
+        return columns
+    finally:
+        cursor.close()
+
+
+def get_standard_column(conn):
+    """model_create 테이블의 정형화 컬럼명 (standard_status 우선, 없으면 standard)"""
+    columns = get_table_columns(conn, 'model_create')
+    return 'standard_status' if 'standard_status' in columns else 'standard'
+
+
+def fetch_ai_daily(conn, start_date, end_date):
+    """ai_response 일자별 토큰 합계 / 호출 건수"""
+    return _read_daily(conn, AI_DAILY_SQL, start_date, end_date, 'ai_response')
+
+
+def fetch_model_daily(conn, start_date, end_date, standard_col=None):
+    """model_create 일자별 생성 건수 / 정형화 건수"""
+    if standard_col is None:
+        standard_col = get_standard_column(conn)
+    sql = MODEL_DAILY_SQL.format(standard_col=standard_col)
+    return _read_daily(conn, sql, start_date, end_date, 'model_create')
+
+
+def fetch_photo_daily(conn, start_date, end_date):
+    """photo_upload 일자별 이미지 수 / SG NO 건수 / Web Open 건수"""
+    return _read_daily(conn, PHOTO_DAILY_SQL, start_date, end_date, 'photo_upload')
+
+
+# ------------------------------
+# 일자별 요약 테이블 (migrations.py로 생성/재집계)
+# ------------------------------
+SUMMARY_TABLES = {
+    'ai_response': 'daily_ai_usage',
+    'model_create': 'daily_model_create',
+    'photo_upload': 'daily_photo_upload',
+}
+SUMMARY_STATE_TABLE = 'summary_state'
+
+
+def _is_missing_table(error):
+    """테이블이 없어서 난 오류인지 (MySQL 1146, 로컬 대체 DB는 SQLite의 no such table)"""
+    if isinstance(error, errors.ProgrammingError):
+        return error.errno == errorcode.ER_NO_SUCH_TABLE
+    return isinstance(error, sqlite3.OperationalError) and 'no such table' in str(error)
+
+
+def get_summary_until(conn, table):
+    """요약 테이블이 빈틈없이 확정된 마지막 날짜 (요약 테이블을 쓸 수 없으면 None)"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            f"SELECT rebuilt_until FROM `{SUMMARY_STATE_TABLE}` WHERE table_name = %s",
+            (SUMMARY_TABLES[table],)
+        )
+        row = cursor.fetchone()
+    except (errors.ProgrammingError, sqlite3.OperationalError) as e:
+        # 마이그레이션 전이면 summary_state 테이블이 없음. 그 밖의 오류(권한, 연결 등)는 그대로 올린다
+        if _is_missing_table(e):
+            return None
+        raise
+    finally:
+        cursor.close()
+    if row is None or row[0] is None:
+        return None
+    value = row[0]
+    return value if isinstance(value, date) else date.fromisoformat(str(value))
+
+
+def fetch_summary_daily(conn, table, start_date, end_date):
+    """요약 테이블에서 일자별 집계 조회 (원본 집계 쿼리와 같은 컬럼)"""
+    column_sql = ", ".join(f"`{col}`" for col in DAILY_SCHEMAS[table])
+    sql = f"""
+    SELECT `date`, {column_sql}
+    FROM `{SUMMARY_TABLES[table]}`
+    WHERE `date` >= %s AND `date` < %s
+    """
+    return _read_daily(conn, sql, start_date, end_date, table)
+
+
+def read_daily(conn, table, start_date, end_date, fetch_raw):
+    """요약 테이블이 확정된 날짜까지는 요약에서, 이후(당일 등)는 원본에서 일자별 집계 조회
+
+    Args:
+        fetch_raw: 원본 테이블 집계 함수 fetch_raw(conn, start_date, end_date)
+    """
+    until = get_summary_until(conn, table)
+    if until is None or start_date > until:
+        return fetch_raw(conn, start_date, end_date)
+    summary = fetch_summary_daily(conn, table, start_date, min(end_date, until))
+    if end_date <= until:
+        return summary
+    return pd.concat([summary, fetch_raw(conn, until + timedelta(days=1), end_date)])
+
+
+# ------------------------------
+# 원본 행 조회 (필요한 화면에서만 사용)
+# ------------------------------
+def fetch_raw_rows(conn, table, start_date, end_date, standard_col=None):
+    """기간 내 원본 행 조회 (schema.RAW_SCHEMAS에 선언된 컬럼만, dtype 축소)
+
+    Args:
+        conn: DB 연결
+        table: 테이블명 (ai_response, model_create, photo_upload)
+        start_date: 시작 일
+        end_date: 종료 일 (포함)
+        standard_col: model_create 정형화 컬럼명 (없으면 조회)
+    """
+    if table == 'model_create' and standard_col is None:
+        standard_col = get_standard_column(conn)
+    schema = raw_schema(table, standard_col) if standard_col else raw_schema(table)
+    column_sql = ", ".join(f"`{col}`" for col in schema)
+    sql = f"SELECT {column_sql} FROM `{table}` WHERE `date` >= %s AND `date` < %s"
+    df = pd.read_sql_query(sql, conn, params=date_bounds(start_date, end_date))
+    return downcast(df, schema)
+
+
+# 원본 행 drill-down 페이지네이션 키 (auto increment PK)
+ROW_ID_COLUMN = 'id'
+DEFAULT_PAGE_SIZE = 100
+
+
+def fetch_raw_page(conn, table, day, after_id=0, limit=DEFAULT_PAGE_SIZE, standard_col=None):
+    """하루치 원본 행 한 페이지 조회 (keyset 페이지네이션)
+
+    OFFSET 대신 직전 페이지의 마지막 id 이후부터 읽으므로 앞 페이지 행을 건너뛰며 읽지 않는다.
+    date 커버링 인덱스로 하루치 범위를 읽고 id > after_id 인 행만 정렬하므로, 비용은
+    몇 번째 페이지인지가 아니라 하루치 행 수에 비례한다.
+
+    Args:
+        conn: DB 연결
+        table: 테이블명 (model_create, photo_upload)
+        day: 조회할 날짜
+        after_id: 직전 페이지의 마지막 id (첫 페이지는 0)
+        limit: 페이지 크기
+        standard_col: model_create 정형화 컬럼명 (없으면 조회)
+
+    Returns:
+        (page, has_next)
+    """
+    if table == 'model_create' and standard_col is None:
+        standard_col = get_standard_column(conn)
+    schema = raw_schema(table, standard_col) if standard_col else raw_schema(table)
+    column_sql = ", ".join(f"`{col}`" for col in [ROW_ID_COLUMN, *schema])
+    sql = f"""
+    SELECT {column_sql}
+    FROM `{table}`
+    WHERE `date` >= %s AND `date` < %s AND `{ROW_ID_COLUMN}` > %s
+    ORDER BY `{ROW_ID_COLUMN}`
+    LIMIT %s
+    """
+    # 다음 페이지 여부를 알기 위해 한 행 더 조회
+    df = pd.read_sql_query(sql, conn, params=(*date_bounds(day, day), after_id, limit + 1))
+    return downcast(df.iloc[:limit], schema), len(df) > limit
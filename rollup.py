@@ -0,0 +1,88 @@
+"""
+일자별 롤업 큐브
+세 테이블의 일자별 집계를 하나의 날짜 인덱스로 합치고 누적합을 저장해 두어
+어떤 기간의 합계든 경계 두 곳의 누적합 차이로 바로 계산한다.
+"""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+
+API_COST_PER_CALL = 0.25    # API 사용 비용 = 요청 건수 * $0.25
+
+ROLLUP_COLUMNS = [
+    'token_sum', 'count', 'cost',                   # ai_response
+    'model_count', 'standardized',                  # model_create
+    'sgno_count', 'image_count', 'web_open_chk',    # photo_upload
+]
+
+
+class DailyRollup:
+    """일자별 롤업 + 누적합(prefix sum)
+
+    daily: 날짜별 ROLLUP_COLUMNS (데이터가 없는 테이블은 0)
+    prefix[col][i]: daily[col]의 앞에서부터 i개 행 합계 (prefix[col][0] == 0)
+    """
+
+    def __init__(self, df_ai, df_model, df_photo):
+        daily = pd.concat([
+            df_ai[['token_sum', 'count']],
+            df_model.rename(columns={'total_count': 'model_count'})[['model_count', 'standardized']],
+            df_photo.rename(columns={'count_sum': 'image_count'})[['sgno_count', 'image_count', 'web_open_chk']],
+        ], axis=1).sort_index().fillna(0).astype('int64')
+        daily['cost'] = daily['count'] * API_COST_PER_CALL
+        self.daily = daily[ROLLUP_COLUMNS]
+        self.prefix = {
+            col: np.concatenate([[0], self.daily[col].cumsum().to_numpy()])
+            for col in ROLLUP_COLUMNS
+        }
+        for values in self.prefix.values():
+            values.setflags(write=False)    # 세션 간 공유되므로 읽기 전용
+
+    def _bounds(self, start_date, end_date):
+        """start_date ~ end_date(포함)에 해당하는 행 위치 [lo, hi)
+
+        start_date > end_date면 빈 구간(hi == lo)이므로 합계는 0이다.
+        """
+        index = self.daily.index
+        lo = index.searchsorted(pd.Timestamp(start_date), side='left')
+        hi = index.searchsorted(pd.Timestamp(end_date) + pd.Timedelta(days=1), side='left')
+        return lo, max(hi, lo)
+
+    def totals(self, start_date, end_date):
+        """기간 합계 (이진 탐색 2번 + 누적합 차이, O(log n))"""
+        lo, hi = self._bounds(start_date, end_date)
+        return {col: self.prefix[col][hi] - self.prefix[col][lo] for col in ROLLUP_COLUMNS}
+
+
+def calculate_period_stats(rollup, days_ago):
+    """기간별 통계를 계산하는 함수
+
+    일자별 롤업의 누적합 차이로 계산하므로 원본 행 수와 무관하게 O(log n)
+
+    Args:
+        rollup: 일자별 롤업 (DailyRollup)
+        days_ago: 며칠 전부터 계산할지 (1: 금일, 7: 주간, 30: 월간)
+    """
+    end_date = datetime.now().date()
+    start_date = end_date - timedelta(days=days_ago-1)
+
+    totals = rollup.totals(start_date, end_date)
+    marketablity_count = int(totals['count'])
+    marketablity_tokens = int(totals['token_sum'])
+    marketablity_cost = float(totals['cost'])
+    model_create_count = int(totals['model_count'])
+    sgno_count = int(totals['sgno_count'])
+    images_count = int(totals['image_count'])
+
+    return {
+        'start_date': start_date,
+        'end_date': end_date,
+        'marketablity_count': marketablity_count,
+        'marketablity_tokens': marketablity_tokens,
+        'marketablity_cost': marketablity_cost,
+        'model_create_count': model_create_count,
+        'sgno_count': sgno_count,
+        'images_count': images_count
+    }
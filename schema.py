@@ -0,0 +1,91 @@
+"""
+테이블 스키마 선언
+대시보드가 실제로 사용하는 컬럼만 조회하고, 컬럼 종류에 맞춰 dtype을 줄여서
+캐시 메모리(워커 수만큼 곱해짐)를 최소화한다.
+
+컬럼 종류
+    int: 정수 (값 범위에 맞춰 int8/int16/int32/int64로 축소)
+    flag: 0/1 값 (int8)
+    category: 반복되는 문자열 (category)
+    date: 날짜 (datetime64)
+"""
+import pandas as pd
+
+
+# model_create 정형화 컬럼은 테이블에 따라 standard_status 또는 standard
+STANDARD_COLUMN = 'standard_status'
+
+# 원본 테이블에서 조회할 컬럼
+RAW_SCHEMAS = {
+    'ai_response': {'job_id': 'int', 'token': 'int', 'date': 'date'},
+    'model_create': {'model_id': 'int', STANDARD_COLUMN: 'flag', 'date': 'date'},
+    'photo_upload': {'sgno': 'category', 'count': 'int', 'web_open_chk': 'flag', 'date': 'date'},
+}
+
+# 일자별 집계 프레임 (date 인덱스 제외)
+DAILY_SCHEMAS = {
+    'ai_response': {'token_sum': 'int', 'count': 'int'},
+    'model_create': {'total_count': 'int', 'standardized': 'int'},
+    'photo_upload': {'count_sum': 'int', 'sgno_count': 'int', 'web_open_chk': 'int'},
+}
+
+
+def raw_schema(table, standard_col=STANDARD_COLUMN):
+    """원본 테이블 스키마 (model_create는 실제 정형화 컬럼명으로 치환)"""
+    schema = RAW_SCHEMAS[table]
+    if table == 'model_create' and standard_col != STANDARD_COLUMN:
+        schema = {(standard_col if col == STANDARD_COLUMN else col): kind for col, kind in schema.items()}
+    return schema
+
+
+def downcast(frame, schema):
+    """스키마의 컬럼 종류에 맞춰 dtype 축소 (새 데이터프레임 반환)"""
+    converted = {}
+    for col, kind in schema.items():
+        if col not in frame.columns:
+            continue
+        series = frame[col]
+        if kind == 'int' and pd.api.types.is_numeric_dtype(series) and not series.isna().any():
+            converted[col] = pd.to_numeric(series, downcast='integer')
+        elif kind == 'flag' and not series.isna().any():
+            converted[col] = series.astype('int8')
+        elif kind == 'category':
+            converted[col] = series.astype('category')
+        elif kind == 'date':
+            converted[col] = pd.to_datetime(series)
+    return frame.assign(**converted)
+
+
+def _undowncast(frame):
+    """축소하지 않았을 때의 기본 dtype (정수 int64, 문자열 object)"""
+    upcast = {}
+    for col in frame.columns:
+        dtype = frame[col].dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            upcast[col] = frame[col].astype(object)
+        elif pd.api.types.is_integer_dtype(dtype):
+            upcast[col] = frame[col].astype('int64')
+    return frame.assign(**upcast)
+
+
+def memory_report(frames):
+    """프레임별 메모리 사용량 (측정값 + dtype을 축소하지 않았을 때의 추정치)
+
+    추정치는 지금의 일자별 프레임을 기본 dtype(int64/object)으로 바꿔서 잰 값이다.
+    변경 전(원본 행 프레임)의 실제 사용량이 아니며, 같은 프레임에서 dtype 축소만의 효과를 보여준다.
+
+    Args:
+        frames: {테이블명: 데이터프레임}
+    """
+    rows = []
+    for table, frame in frames.items():
+        estimate = int(_undowncast(frame).memory_usage(deep=True).sum())
+        measured = int(frame.memory_usage(deep=True).sum())
+        rows.append({
+            'Table': table,
+            'Rows': len(frame),
+            'Bytes': measured,
+            'Bytes if int64 (estimate)': estimate,
+            'Saved vs int64 (%)': round((1 - measured / estimate) * 100, 1) if estimate else 0.0,
+        })
+    return pd.DataFrame(rows)
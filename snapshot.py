@@ -0,0 +1,86 @@
+"""
+일자별 집계 스냅샷 (Arrow IPC 파일)
+프로세스가 재시작되어도 마지막으로 적재한 집계를 디스크에서 바로 읽어
+첫 화면을 DB 조회 없이 그릴 수 있도록 한다.
+"""
+import json
+import os
+import uuid
+from datetime import date, datetime
+from pathlib import Path
+
+import pyarrow as pa
+
+
+META_FILE = "meta.json"
+
+
+def _write_atomic(path, write):
+    """임시 파일에 쓴 뒤 교체하여 읽는 쪽에서 반쯤 쓰인 파일을 보지 않도록 함
+
+    임시 파일 이름에 pid와 uuid를 붙여서, 여러 프로세스/스레드가 동시에 써도 서로의 임시 파일을 덮어쓰지 않는다.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _write_table(path, frame):
+    table = pa.Table.from_pandas(frame, preserve_index=True)
+    with pa.OSFile(str(path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def _read_table(path):
+    # 메모리 맵으로 열어서 파일 전체를 읽어 들이지 않고 필요한 버퍼만 매핑
+    with pa.memory_map(str(path), "r") as source:
+        return pa.ipc.open_file(source).read_all().to_pandas()
+
+
+def save_snapshot(directory, frames, meta):
+    """테이블별 데이터프레임과 메타 정보를 directory에 저장
+
+    Args:
+        directory: 스냅샷 디렉터리
+        frames: {테이블명: 일자별 집계 데이터프레임}
+        meta: 적재 범위, high-water mark, 갱신 시각 등 (JSON 직렬화 가능한 값)
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for table, frame in frames.items():
+        _write_atomic(directory / f"{table}.arrow", lambda path, frame=frame: _write_table(path, frame))
+    # 메타 파일을 마지막에 교체해야 프레임이 모두 쓰인 뒤에만 스냅샷이 유효해진다
+    _write_atomic(
+        directory / META_FILE,
+        lambda path: path.write_text(json.dumps(meta, default=encode_json), encoding="utf-8")
+    )
+
+
+def load_snapshot(directory, tables):
+    """저장된 스냅샷 로드. 없거나 읽을 수 없으면 None
+
+    Returns:
+        (frames, meta)
+    """
+    directory = Path(directory)
+    meta_path = directory / META_FILE
+    if not meta_path.exists():
+        return None
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        frames = {table: _read_table(directory / f"{table}.arrow") for table in tables}
+    except (OSError, ValueError, pa.ArrowException):
+        return None
+    return frames, meta
+
+
+def encode_json(value):
+    """json.dumps default: date/datetime은 ISO 형식 문자열로 (스냅샷 메타, export.py 응답 공용)"""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,573 @@
+"""
+일자별 집계 저장소
+테이블별로 마지막으로 확인한 날짜(high-water mark)를 기억해 두고,
+새로고침 시 그 이후 데이터만 다시 조회해서 기존 집계에 병합한다.
+적재/새로고침 결과는 새 상태 객체로 만들어 한 번에 교체하므로 읽는 쪽은 잠금 없이
+항상 마지막으로 완료된 상태를 본다.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+from coordinator import RefreshCoordinator
+from engines import DEFAULT_ENGINE, create_engine
+from ingest import DEFAULT_CHUNK_SIZE, stream_daily
+from queries import fetch_ai_daily, fetch_model_daily, fetch_photo_daily, get_standard_column, read_daily
+from rollup import DailyRollup
+from snapshot import load_snapshot, save_snapshot
+
+
+TABLES = ('ai_response', 'model_create', 'photo_upload')
+
+# 늦게 적재되는 행을 반영하기 위해 high-water mark 이전 며칠을 다시 조회
+LATE_ARRIVAL_DAYS = 3
+
+# 백그라운드 새로고침 주기(초)
+REFRESH_INTERVAL = 300
+
+logger = logging.getLogger("dashboard.store")
+
+
+def enable_copy_on_write():
+    """pandas copy-on-write 켜기 (프로세스 시작 시 한 번, 저장소를 만들기 전에 호출)
+
+    저장소 프레임은 모든 세션이 같이 읽으므로 get_frames()는 얕은 복사본을 돌려준다.
+    copy-on-write가 켜져 있어야 복사본/슬라이스/파생 프레임에 값을 써도 그때만 복사가 일어나고
+    공유 원본은 바뀌지 않는다.
+    """
+    pd.set_option("mode.copy_on_write", True)
+
+
+def slice_range(frame, start_date, end_date):
+    """정렬된 DatetimeIndex에서 start_date ~ end_date(포함) 구간을 잘라냄
+
+    searchsorted 이진 탐색으로 경계만 찾으므로 행 수와 무관하게 O(log n)이며
+    결과는 복사 없이 원본의 뷰(iloc 슬라이스)다.
+    """
+    index = frame.index
+    lo = index.searchsorted(pd.Timestamp(start_date), side='left')
+    hi = index.searchsorted(pd.Timestamp(end_date) + pd.Timedelta(days=1), side='left')
+    return frame.iloc[lo:hi]
+
+
+def frame_checksum(frame):
+    """프레임 내용(인덱스 포함) 해시 합계 (공유 프레임이 바뀌지 않았는지 확인용)"""
+    return int(pd.util.hash_pandas_object(frame, index=True).sum())
+
+
+def slice_before(frame, end_date):
+    """정렬된 DatetimeIndex에서 end_date 이전(미포함) 구간을 잘라냄"""
+    return frame.iloc[:frame.index.searchsorted(pd.Timestamp(end_date), side='left')]
+
+
+def _add_timings(timings, more):
+    """테이블별 조회 시간 합산 (앞/뒤 구간을 모두 조회한 경우)"""
+    return {table: timings.get(table, 0) + more.get(table, 0) for table in {**timings, **more}}
+
+
+class StoreState:
+    """한 번에 교체되는 저장소 상태 (생성 후 변경하지 않음)
+
+    frames: 테이블별 일자별 집계 데이터프레임 (정렬된 datetime64 date 인덱스)
+    rollup: frames로 만든 일자별 롤업
+    version: 데이터가 바뀔 때마다 증가
+    loaded_start / loaded_end: 조회가 끝난 날짜 범위 (포함)
+    high_water: 테이블별 마지막으로 확인한 데이터 날짜
+    refreshed_at: 이 상태를 만든 시각 (화면의 "기준 시각")
+    synced_at: 마지막 증분 새로고침(또는 첫 적재)의 DB 조회 시작 시각
+    timings: 이 상태를 만들 때의 테이블별 조회 시간(초)
+    duration: 이 상태를 만드는 데 걸린 전체 시간(초)
+    checksums: 생성 시점의 테이블별 frame_checksum (modified_tables()로 변경 여부 확인)
+    """
+
+    def __init__(self, frames=None, rollup=None, version=0, loaded_start=None, loaded_end=None,
+                 high_water=None, refreshed_at=None, timings=None, duration=None, synced_at=None):
+        self.frames = frames or {}
+        self.rollup = rollup
+        self.version = version
+        self.loaded_start = loaded_start
+        self.loaded_end = loaded_end
+        self.high_water = high_water or {}
+        self.refreshed_at = refreshed_at
+        self.synced_at = synced_at
+        self.timings = timings or {}
+        self.duration = duration
+        self.checksums = {table: frame_checksum(frame) for table, frame in self.frames.items()}
+
+    def modified_tables(self):
+        """생성 이후 내용이 바뀐 테이블 목록 (정상이면 빈 리스트)
+
+        frames는 세션 간에 복사 없이 공유되므로 호출하는 쪽에서 절대 수정하면 안 된다.
+        """
+        return [table for table, frame in self.frames.items()
+                if frame_checksum(frame) != self.checksums[table]]
+
+    def covers(self, start_date, end_date):
+        """요청 범위가 이미 적재되어 있는지 여부"""
+        return (self.loaded_start is not None
+                and self.loaded_start <= start_date
+                and end_date <= self.loaded_end)
+
+    def get_frames(self):
+        """(ai_response, model_create, photo_upload) 일자별 집계 반환
+
+        공유 프레임 대신 얕은 복사본을 돌려주므로 (copy-on-write에서는 쓰기 전까지 데이터 복사 없음)
+        호출하는 쪽에서 컬럼을 바꿔도 다른 세션에는 영향이 없다.
+        """
+        return tuple(self.frames[table].copy(deep=False) for table in TABLES)
+
+
+class DailyStore:
+    """프로세스 공용 일자별 집계 저장소
+
+    state: 마지막으로 완료된 StoreState. 적재/새로고침은 lock을 잡고 새 상태를 만든 뒤
+    속성 대입 한 번으로 교체하므로, 화면에서는 state를 한 번 읽어서 frames/rollup/version을
+    함께 쓰면 항상 서로 맞는 값을 얻는다 (읽을 때는 잠금이나 DB 대기가 없음).
+    frames, rollup, version 등은 현재 state의 값을 그대로 보여주는 속성이다.
+
+    connect는 with 구문으로 DB 연결을 빌려주는 함수 (db.connection_factory())
+    snapshot_dir을 지정하면 적재할 때마다 스냅샷을 저장하고, 생성 시 스냅샷이
+    있으면 DB 조회 없이 복원한다 (restored=True).
+    ingest_mode: 'sql'이면 DB에서 GROUP BY 집계, 'stream'이면 원본 행을
+    chunksize 단위로 읽으면서 engine으로 집계 (ingest.stream_daily, engines.create_engine)
+    use_summaries: 요약 테이블(migrations.py)이 있으면 확정된 날짜까지는 요약 테이블에서 읽음
+    coordinator: 여러 워커가 snapshot_dir을 공유할 때의 잠금/버전 표시 (coordinator.RefreshCoordinator).
+    DB 조회와 스냅샷 저장은 워커 간 잠금 안에서 하고, 그 전에 다른 워커가 저장한 더 새 스냅샷
+    (generation이 더 큰 것)이 있으면 먼저 가져오므로 같은 구간을 워커마다 다시 조회하지 않는다.
+    """
+
+    def __init__(self, connect, late_days=LATE_ARRIVAL_DAYS, snapshot_dir=None,
+                 ingest_mode='sql', chunksize=DEFAULT_CHUNK_SIZE, use_summaries=True, engine=None,
+                 coordinator=None):
+        self.connect = connect
+        self.use_summaries = use_summaries
+        self.late_days = late_days
+        self.snapshot_dir = snapshot_dir
+        self.ingest_mode = ingest_mode
+        self.chunksize = chunksize
+        self.engine = engine
+        self.coordinator = coordinator if snapshot_dir is not None else None
+        self.lock = threading.Lock()
+        self.state = StoreState()
+        self.generation = 0         # 지금 상태가 반영된 공유 스냅샷 generation
+        self.shared_locked = False  # 워커 간 잠금을 잡고 있는지 (못 잡았으면 공유 스냅샷을 읽거나 쓰지 않음)
+        self.refreshing_since = None    # 이 워커에서 진행 중인 새로고침의 시작 시각
+        self.standard_col = None
+        self.restored = False
+        self.refresher = None
+        self.stopped = threading.Event()
+        if snapshot_dir is not None:
+            self._restore()
+
+    @property
+    def frames(self):
+        return self.state.frames
+
+    @property
+    def rollup(self):
+        return self.state.rollup
+
+    @property
+    def version(self):
+        return self.state.version
+
+    @property
+    def loaded_start(self):
+        return self.state.loaded_start
+
+    @property
+    def loaded_end(self):
+        return self.state.loaded_end
+
+    @property
+    def high_water(self):
+        return self.state.high_water
+
+    @property
+    def refreshed_at(self):
+        return self.state.refreshed_at
+
+    @property
+    def timings(self):
+        return self.state.timings
+
+    def covers(self, start_date, end_date):
+        """요청 범위가 이미 적재되어 있는지 여부"""
+        return self.state.covers(start_date, end_date)
+
+    def get_frames(self):
+        """(ai_response, model_create, photo_upload) 일자별 집계 반환"""
+        return self.state.get_frames()
+
+    def _fetch_table(self, conn, table, start_date, end_date):
+        """테이블 하나의 start_date ~ end_date 일자별 집계 조회"""
+        if table == 'model_create' and self.standard_col is None:
+            self.standard_col = get_standard_column(conn)
+        if self.use_summaries:
+            return read_daily(conn, table, start_date, end_date,
+                              lambda conn, start_date, end_date: self._fetch_raw(conn, table, start_date, end_date))
+        return self._fetch_raw(conn, table, start_date, end_date)
+
+    def _fetch_raw(self, conn, table, start_date, end_date):
+        """원본 테이블에서 일자별 집계 (ingest_mode에 따라 GROUP BY 또는 스트리밍)"""
+        if self.ingest_mode == 'stream':
+            extra = {'standard_col': self.standard_col} if table == 'model_create' else {}
+            return stream_daily(conn, table, start_date, end_date, chunksize=self.chunksize, engine=self.engine,
+                                **extra)
+        if table == 'ai_response':
+            return fetch_ai_daily(conn, start_date, end_date)
+        if table == 'model_create':
+            return fetch_model_daily(conn, start_date, end_date, self.standard_col)
+        return fetch_photo_daily(conn, start_date, end_date)
+
+    def _fetch_timed(self, table, start_date, end_date):
+        """연결을 하나 빌려서 테이블 하나를 조회
+
+        Returns:
+            (frame, 소요 시간(초))
+        """
+        started = time.perf_counter()
+        with self.connect() as conn:
+            frame = self._fetch_table(conn, table, start_date, end_date)
+        return frame, time.perf_counter() - started
+
+    def _fetch(self, ranges):
+        """테이블별 (start_date, end_date) 범위를 동시에 조회
+
+        테이블마다 풀에서 연결을 따로 빌리므로 전체 소요 시간은
+        세 테이블 조회 시간의 합이 아니라 가장 느린 테이블 기준이 된다.
+
+        Returns:
+            ({table: frame}, {table: 소요 시간(초)})
+        """
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = {
+                table: executor.submit(self._fetch_timed, table, start_date, end_date)
+                for table, (start_date, end_date) in ranges.items()
+            }
+            results = {table: future.result() for table, future in futures.items()}
+        frames = {table: frame for table, (frame, _) in results.items()}
+        timings = {table: seconds for table, (_, seconds) in results.items()}
+        return frames, timings
+
+    def _fetch_all(self, start_date, end_date):
+        """세 테이블의 start_date ~ end_date 일자별 집계 조회 (frames, timings)"""
+        return self._fetch({table: (start_date, end_date) for table in TABLES})
+
+    def _load_snapshot(self, version):
+        """스냅샷을 읽어서 상태 생성. 없으면 None
+
+        Returns:
+            (state, generation)
+        """
+        loaded = load_snapshot(self.snapshot_dir, TABLES)
+        if loaded is None:
+            return None
+        frames, meta = loaded
+        for frame in frames.values():
+            # 이전 형식(date 객체 인덱스)으로 저장된 스냅샷도 datetime64 인덱스로 맞춤
+            frame.index = pd.DatetimeIndex(frame.index, name='date')
+        self.standard_col = self.standard_col or meta.get('standard_col')
+        state = StoreState(
+            frames=frames,
+            rollup=DailyRollup(*(frames[table] for table in TABLES)),
+            version=version,
+            loaded_start=date.fromisoformat(meta['loaded_start']),
+            loaded_end=date.fromisoformat(meta['loaded_end']),
+            high_water={table: date.fromisoformat(value) for table, value in meta['high_water'].items()},
+            refreshed_at=datetime.fromisoformat(meta['refreshed_at']),
+            synced_at=datetime.fromisoformat(meta['synced_at']) if meta.get('synced_at') else None,
+        )
+        return state, meta.get('generation', 0)
+
+    def _restore(self):
+        """스냅샷이 있으면 마지막으로 적재한 집계를 복원
+
+        다른 워커가 스냅샷을 쓰는 중일 수 있으므로 워커 간 잠금 안에서 읽고, 잠금을 못 잡으면 복원하지 않는다.
+        """
+        with self.lock, self._shared_lock():
+            if self.coordinator is not None and not self.shared_locked:
+                return
+            loaded = self._load_snapshot(version=1)
+            if loaded is None:
+                return
+            self.state, self.generation = loaded
+            self.restored = True
+
+    @contextmanager
+    def _shared_lock(self):
+        """워커 간 잠금 (lock을 잡은 상태에서 사용, coordinator가 없으면 아무것도 하지 않음)"""
+        if self.coordinator is None:
+            yield
+            return
+        with self.coordinator.locked() as acquired:
+            self.shared_locked = acquired
+            try:
+                yield
+            finally:
+                self.shared_locked = False
+
+    def _adopt_shared(self):
+        """다른 워커가 더 새 스냅샷을 저장했으면 가져옴
+
+        lock과 워커 간 잠금을 잡은 상태에서 호출한다. 이 워커만 적재한 구간(공유 스냅샷 범위 밖)이
+        있으면 합쳐서 다시 저장하므로 공유 스냅샷의 범위는 줄어들지 않는다.
+
+        Returns:
+            가져왔는지 여부
+        """
+        if (self.coordinator is None or not self.shared_locked
+                or self.coordinator.generation() <= self.generation):
+            return False
+        state = self.state
+        loaded = self._load_snapshot(state.version + 1)
+        if loaded is None:
+            return False
+        shared, self.generation = loaded
+        one_day = timedelta(days=1)
+        if (state.loaded_start is None or shared.covers(state.loaded_start, state.loaded_end)
+                or state.loaded_start > shared.loaded_end + one_day
+                or state.loaded_end < shared.loaded_start - one_day):
+            # 이어지지 않는 구간은 합치지 않음 (필요하면 ensure_range가 다시 조회)
+            self.state = shared
+            return True
+        frames = {}
+        for table in TABLES:
+            parts = [slice_before(state.frames[table], shared.loaded_start), shared.frames[table]]
+            if state.loaded_end > shared.loaded_end:
+                parts.append(slice_range(state.frames[table], shared.loaded_end + one_day, state.loaded_end))
+            frames[table] = pd.concat(parts)
+        self._commit(frames, min(state.loaded_start, shared.loaded_start), max(state.loaded_end, shared.loaded_end),
+                     {}, time.perf_counter(), shared.synced_at)
+        return True
+
+    def sync(self):
+        """다른 워커가 저장한 더 새 스냅샷이 있으면 디스크에서 다시 읽음
+
+        버전 표시 파일만 읽어서 비교하므로 자주 호출해도 가볍다.
+
+        Returns:
+            가져왔는지 여부
+        """
+        if self.coordinator is None or self.coordinator.generation() <= self.generation:
+            return False
+        with self.lock, self._shared_lock():
+            return self._adopt_shared()
+
+    def _save(self, state):
+        """상태를 스냅샷으로 저장하고 generation을 올림"""
+        if self.snapshot_dir is None:
+            return
+        if self.coordinator is not None and not self.shared_locked:
+            # 잠금 없이 쓰면 다른 워커의 스냅샷과 섞일 수 있으므로 이번 결과는 이 워커 메모리에만 둠
+            logger.warning("skipping snapshot save: refresh lock not held")
+            return
+        generation = self.generation + 1
+        if self.coordinator is not None:
+            generation = max(generation, self.coordinator.generation() + 1)
+        meta = {
+            'loaded_start': state.loaded_start,
+            'loaded_end': state.loaded_end,
+            'high_water': state.high_water,
+            'standard_col': self.standard_col,
+            'refreshed_at': state.refreshed_at,
+            'synced_at': state.synced_at,
+            'generation': generation,
+        }
+        try:
+            save_snapshot(self.snapshot_dir, state.frames, meta)
+            if self.coordinator is not None:
+                # 스냅샷 파일을 모두 쓴 뒤에 버전 표시를 올려야 다른 워커가 완성된 스냅샷만 읽는다
+                self.coordinator.write_stamp(generation, state.refreshed_at)
+        except OSError:
+            # 스냅샷은 재시작 속도를 위한 것이므로 저장 실패로 화면을 막지 않음
+            return
+        self.generation = generation
+
+    def _commit(self, frames, loaded_start, loaded_end, timings, started, synced_at):
+        """새 프레임으로 high-water mark / 롤업 / 버전을 계산한 상태를 만들어 교체하고 스냅샷 저장
+
+        lock(과 워커 간 잠금)을 잡은 상태에서 호출한다.
+        """
+        high_water = {
+            table: frames[table].index[-1].date() if not frames[table].empty else loaded_start
+            for table in TABLES
+        }
+        state = StoreState(
+            frames=frames,
+            rollup=DailyRollup(*(frames[table] for table in TABLES)),
+            version=self.state.version + 1,
+            loaded_start=loaded_start,
+            loaded_end=loaded_end,
+            high_water=high_water,
+            refreshed_at=datetime.now(),
+            timings=timings,
+            duration=time.perf_counter() - started,
+            synced_at=synced_at,
+        )
+        self.state = state
+        self._save(state)
+
+    def ensure_range(self, start_date, end_date):
+        """start_date ~ end_date 범위 중 아직 조회하지 않은 구간만 조회해서 적재"""
+        if self.covers(start_date, end_date):
+            return
+        with self.lock, self._shared_lock():
+            self._adopt_shared()
+            state = self.state
+            if state.covers(start_date, end_date):
+                return
+            started = time.perf_counter()
+            synced_at = state.synced_at
+            if state.loaded_start is None:
+                synced_at = datetime.now()
+                frames, timings = self._fetch_all(start_date, end_date)
+                loaded_start, loaded_end = start_date, end_date
+            else:
+                frames, timings = dict(state.frames), {}
+                loaded_start, loaded_end = state.loaded_start, state.loaded_end
+                if start_date < loaded_start:
+                    older, older_timings = self._fetch_all(start_date, loaded_start - timedelta(days=1))
+                    timings = _add_timings(timings, older_timings)
+                    for table in TABLES:
+                        frames[table] = pd.concat([older[table], frames[table]])
+                    loaded_start = start_date
+                if end_date > loaded_end:
+                    newer, newer_timings = self._fetch_all(loaded_end + timedelta(days=1), end_date)
+                    timings = _add_timings(timings, newer_timings)
+                    for table in TABLES:
+                        frames[table] = pd.concat([frames[table], newer[table]])
+                    loaded_end = end_date
+            self._commit(frames, loaded_start, loaded_end, timings, started, synced_at)
+
+    def refresh(self, max_age=0):
+        """증분 새로고침
+
+        테이블별 high-water mark - late_days 이후 구간만 다시 집계해서 교체한다.
+        새로고침 비용은 테이블 전체 크기가 아니라 최근 적재량에 비례한다.
+        잠금을 기다리는 동안 (이 워커나 다른 워커에서) 호출 시점 - max_age초 이후에 시작했거나
+        호출 시점에 이미 진행 중이던 새로고침이 끝났으면 DB를 다시 조회하지 않고 그 결과를 사용한다.
+        """
+        requested = datetime.now() - timedelta(seconds=max_age)
+        in_flight = self._refreshing_since()
+        if in_flight is not None:
+            requested = min(requested, in_flight)
+        with self.lock, self._shared_lock():
+            self._adopt_shared()
+            state = self.state
+            if state.loaded_start is None:
+                return
+            if state.synced_at is not None and state.synced_at >= requested:
+                return
+            started = time.perf_counter()
+            synced_at = datetime.now()
+            self.refreshing_since = synced_at
+            if self.shared_locked:
+                self.coordinator.mark_refreshing(synced_at)
+            try:
+                end_date = max(synced_at.date(), state.loaded_end)
+                since = {
+                    table: max(state.high_water[table] - timedelta(days=self.late_days), state.loaded_start)
+                    for table in TABLES
+                }
+                delta, timings = self._fetch({table: (since[table], end_date) for table in TABLES})
+                frames = {
+                    table: pd.concat([slice_before(state.frames[table], since[table]), delta[table]])
+                    for table in TABLES
+                }
+                self._commit(frames, state.loaded_start, end_date, timings, started, synced_at)
+            finally:
+                self.refreshing_since = None
+
+    def _refreshing_since(self):
+        """이 워커나 다른 워커에서 지금 진행 중인 새로고침의 시작 시각 (없으면 None)"""
+        if self.refreshing_since is not None:
+            return self.refreshing_since
+        if self.coordinator is not None:
+            return self.coordinator.refreshing_since()
+        return None
+
+    def reload(self):
+        """전체 다시 적재 (Full Reload)
+
+        스냅샷이나 이전 상태를 재사용하지 않고 적재된 범위 전체를 DB에서 다시 조회해서 교체한다.
+        새 결과가 스냅샷으로 저장되므로 다른 워커도 버전 표시를 보고 따라온다.
+        """
+        with self.lock, self._shared_lock():
+            self._adopt_shared()    # 다른 워커가 넓혀 둔 범위까지 포함
+            state = self.state
+            if state.loaded_start is None:
+                return
+            started = time.perf_counter()
+            synced_at = datetime.now()
+            end_date = max(synced_at.date(), state.loaded_end)
+            self.standard_col = None
+            frames, timings = self._fetch_all(state.loaded_start, end_date)
+            self._commit(frames, state.loaded_start, end_date, timings, started, synced_at)
+
+    def start_refresher(self, interval):
+        """백그라운드 새로고침 스레드 시작 (저장소당 하나)
+
+        바로 한 번 증분 새로고침하고(스냅샷 복원 후 DB와의 차이 반영) 이후 interval초마다
+        반복한다. interval이 0 이하면 첫 새로고침만 한다. 화면은 새로고침이 끝날 때까지
+        이전 상태를 그대로 사용한다.
+        coordinator가 있으면 최근 interval초 안에 다른 워커가 새로고침했을 때는 그 결과를 쓰고,
+        새로고침 사이에도 sync_interval초마다 버전 표시를 확인해서 다른 워커의 결과를 가져온다.
+        """
+        if self.refresher is not None:
+            return
+
+        def run():
+            next_refresh = time.monotonic()
+            while not self.stopped.is_set():
+                try:
+                    if time.monotonic() >= next_refresh:
+                        next_refresh = time.monotonic() + interval if interval > 0 else float('inf')
+                        self.refresh(max_age=max(interval, 0))
+                    else:
+                        self.sync()
+                except Exception:
+                    # 일시적인 DB 오류로 스레드가 끝나지 않도록 기록만 하고 다음 주기에 재시도
+                    logger.exception("background refresh failed")
+                if self.coordinator is None:
+                    if interval <= 0:
+                        return
+                    timeout = next_refresh - time.monotonic()
+                else:
+                    timeout = min(self.coordinator.sync_interval, next_refresh - time.monotonic())
+                if self.stopped.wait(max(timeout, 0)):
+                    return
+
+        self.refresher = threading.Thread(target=run, name="store-refresher", daemon=True)
+        self.refresher.start()
+
+    def stop_refresher(self):
+        """백그라운드 새로고침 중지 (저장소를 버릴 때)"""
+        self.stopped.set()
+
+
+def create_store(connect, config, base_dir):
+    """[dashboard] 설정으로 저장소 생성 (대시보드와 export.py 공용)
+
+    Args:
+        connect: with 구문으로 DB 연결을 빌려주는 함수
+        config: st.secrets["dashboard"] 설정 (dict)
+        base_dir: snapshot_dir 상대 경로 기준 디렉터리
+    """
+    snapshot_dir = Path(base_dir) / config.get("snapshot_dir", ".snapshot")
+    return DailyStore(
+        connect=connect,
+        late_days=int(config.get("late_arrival_days", LATE_ARRIVAL_DAYS)),
+        snapshot_dir=snapshot_dir,
+        ingest_mode=config.get("ingest_mode", "sql"),
+        chunksize=int(config.get("chunk_size", DEFAULT_CHUNK_SIZE)),
+        use_summaries=bool(config.get("use_summaries", True)),
+        engine=create_engine(config.get("engine", DEFAULT_ENGINE), config.get("engine_threads")),
+        coordinator=RefreshCoordinator(snapshot_dir) if config.get("coordinate_workers", True) else None
+    )
@@ -0,0 +1,44 @@
+"""
+테스트 공용 설정
+저장소 모듈은 저장소 루트, 로컬 대체 DB(SQLite)는 benchmarks/standin.py에서 가져온다.
+"""
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+sys.path.insert(0, str(ROOT_DIR / "benchmarks"))
+
+from standin import QueryCounter, connection_factory, create_database
+from store import DailyStore, enable_copy_on_write
+
+
+TEST_ROWS = 2000
+TEST_DAYS = 60
+
+
+@pytest.fixture(scope="session", autouse=True)
+def copy_on_write():
+    enable_copy_on_write()
+
+
+@pytest.fixture(scope="session")
+def standin_path(tmp_path_factory):
+    return create_database(TEST_ROWS, days=TEST_DAYS, path=tmp_path_factory.mktemp("standin") / "standin.db")
+
+
+@pytest.fixture
+def query_counter():
+    return QueryCounter()
+
+
+@pytest.fixture
+def loaded_store(standin_path, query_counter):
+    """최근 30일이 적재된 저장소 (스냅샷 없음)"""
+    store = DailyStore(connection_factory(standin_path, query_counter))
+    today = date.today()
+    store.ensure_range(today - timedelta(days=29), today)
+    return store
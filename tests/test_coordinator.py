@@ -0,0 +1,83 @@
+"""
+워커 간 새로고침 조정
+snapshot_dir을 공유하는 저장소(워커) 둘로, 진행 중인 새로고침이 있을 때 들어온 새로고침 요청은
+DB를 다시 조회하지 않고 그 결과를 쓰는지, 잠금 없이는 스냅샷을 쓰지 않는지 확인한다.
+"""
+import threading
+from datetime import date, timedelta
+
+import pytest
+
+from coordinator import RefreshCoordinator
+from standin import QueryCounter, connection_factory
+from store import DailyStore
+
+pytestmark = pytest.mark.filterwarnings("ignore::UserWarning")
+
+
+def make_worker(standin_path, snapshot_dir, **coordinator_args):
+    counter = QueryCounter()
+    store = DailyStore(connection_factory(standin_path, counter), snapshot_dir=snapshot_dir,
+                       coordinator=RefreshCoordinator(snapshot_dir, **coordinator_args))
+    return store, counter
+
+
+def test_request_during_refresh_uses_its_result(standin_path, tmp_path):
+    first, first_counter = make_worker(standin_path, tmp_path)
+    today = date.today()
+    first.ensure_range(today - timedelta(days=6), today)
+    second, second_counter = make_worker(standin_path, tmp_path)
+    assert second.restored
+
+    # 첫 워커의 새로고침을 조회 도중에 멈춰 두고 그동안 두 번째 워커가 새로고침을 요청
+    fetching, release = threading.Event(), threading.Event()
+    fetch = first._fetch
+
+    def slow_fetch(ranges):
+        fetching.set()
+        release.wait(10)
+        return fetch(ranges)
+
+    # 두 번째 워커가 진행 중인 새로고침 시작 시각을 읽고 워커 간 잠금을 기다리기 시작한 뒤에 풀어줌
+    seen, waiting = [], threading.Event()
+    refreshing_since, acquire = second._refreshing_since, second.coordinator._acquire
+
+    def record_refreshing_since():
+        seen.append(refreshing_since())
+        return seen[-1]
+
+    def waiting_acquire(fd):
+        waiting.set()
+        return acquire(fd)
+
+    first._fetch = slow_fetch
+    second._refreshing_since = record_refreshing_since
+    second.coordinator._acquire = waiting_acquire
+    refresher = threading.Thread(target=first.refresh)
+    refresher.start()
+    assert fetching.wait(10)
+    queries_before = first_counter.value
+    waiter = threading.Thread(target=second.refresh)
+    waiter.start()
+    assert waiting.wait(10)
+    assert refresher.is_alive()
+    release.set()
+    refresher.join(10)
+    waiter.join(10)
+
+    assert seen == [first.state.synced_at]
+    assert first_counter.value > queries_before
+    assert second_counter.value == 0
+    assert second.state.synced_at == first.state.synced_at
+
+
+def test_no_snapshot_write_without_lock(standin_path, tmp_path):
+    holder = RefreshCoordinator(tmp_path)
+    store, _ = make_worker(standin_path, tmp_path, lock_timeout=0.2)
+    today = date.today()
+    with holder.locked():
+        store.ensure_range(today - timedelta(days=6), today)
+
+    assert store.state.loaded_start == today - timedelta(days=6)
+    assert holder.generation() == 0
+    assert not any(tmp_path.glob("*.arrow"))
@@ -0,0 +1,46 @@
+"""
+집계 엔진 비교
+같은 chunk에 대해 pandas 엔진과 DuckDB 엔진이 같은 일자별 집계(컬럼, dtype, 인덱스)를 반환해야 한다.
+chunk는 stream_daily와 같은 방식(from_records + downcast)으로 만들고 NULL 날짜/값을 섞는다.
+"""
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from engines import DuckDBEngine, PandasEngine
+from schema import downcast, raw_schema
+
+pytest.importorskip("duckdb")
+
+DAY1 = datetime(2025, 1, 1, 9, 30)
+DAY1_LATE = datetime(2025, 1, 1, 23, 59, 59)
+DAY2 = datetime(2025, 1, 3, 0, 0)
+
+ROWS = {
+    'ai_response': [
+        (1, 100, DAY1), (2, None, DAY1_LATE), (3, 50, DAY2), (4, 70, None), (5, None, DAY2),
+    ],
+    'model_create': [
+        (1, 1, DAY1), (2, 0, DAY1_LATE), (None, 1, DAY1), (4, None, DAY2), (5, 1, None), (6, 1, DAY2),
+    ],
+    'photo_upload': [
+        ('A-1', 3, 1, DAY1), ('A-1', None, 0, DAY1_LATE), (None, 2, None, DAY2), ('B-2', 5, 1, None),
+        ('B-2', 1, 1, DAY2),
+    ],
+}
+
+
+def make_chunk(table):
+    schema = raw_schema(table)
+    return downcast(pd.DataFrame.from_records(ROWS[table], columns=list(schema)), schema)
+
+
+@pytest.mark.parametrize("table", ROWS)
+def test_duckdb_matches_pandas(table):
+    chunk = make_chunk(table)
+    expected = PandasEngine().aggregate(table, chunk)
+    result = DuckDBEngine(threads=1).aggregate(table, chunk)
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert len(expected) == 2
@@ -0,0 +1,58 @@
+"""
+내보내기
+데이터가 있는 기간과 없는 기간 모두 CSV 헤더와 Arrow 스키마가 EXPORT_SCHEMAS와 같아야 하고,
+HTTP 서버는 보고서를 만들다 오류가 나도 연결을 끊지 않고 500으로 응답해야 한다.
+"""
+import json
+import threading
+import urllib.error
+import urllib.request
+from datetime import date, timedelta
+from http.server import ThreadingHTTPServer
+
+import pyarrow as pa
+import pytest
+
+from export import EXPORT_SCHEMAS, TABLES, Exporter, make_handler, render
+from memo import RangeMemo
+
+pytestmark = pytest.mark.filterwarnings("ignore::UserWarning")
+
+RANGES = {
+    'loaded': (date.today() - timedelta(days=6), date.today()),
+    'empty': (date(2001, 1, 1), date(2001, 1, 7)),
+}
+
+
+@pytest.mark.parametrize("range_name", RANGES)
+@pytest.mark.parametrize("table", TABLES)
+def test_export_schema_is_fixed(loaded_store, range_name, table):
+    report = Exporter(loaded_store, RangeMemo(4)).report(*RANGES[range_name])
+    schema = EXPORT_SCHEMAS[table]
+
+    arrow_table = pa.ipc.open_stream(render(report, 'arrow', table)).read_all()
+    assert arrow_table.schema.equals(schema)
+    header = render(report, 'csv', table).decode('utf-8').splitlines()[0]
+    assert header == ','.join(schema.names)
+
+
+def test_report_error_returns_500(loaded_store, caplog):
+    exporter = Exporter(loaded_store, RangeMemo(4))
+
+    def fail(start_date, end_date):
+        raise RuntimeError("db down")
+
+    exporter.report = fail
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(exporter))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(f"http://127.0.0.1:{server.server_port}/report", timeout=10)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert error.value.code == 500
+    assert json.loads(error.value.read()) == {'error': "report failed"}
+    assert "report failed" in caplog.text
@@ -0,0 +1,53 @@
+"""
+단계 지표 텍스트 파일
+여러 세션 스레드가 동시에 rerun을 기록해도 텍스트 파일 쓰기가 실패하거나 임시 파일이 남지 않아야 하고,
+rerun마다가 아니라 textfile_interval마다 한 번만 써야 한다.
+"""
+import logging
+import threading
+
+from instrument import RunTrace, StageMetrics, export_trace
+
+THREADS = 8
+RUNS = 200
+
+
+def make_trace():
+    trace = RunTrace("app")
+    with trace.stage("load_data") as record:
+        record['rows'] = 10
+        record['cache'] = 'hit'
+    return trace
+
+
+def test_concurrent_writes_do_not_fail(tmp_path, caplog):
+    textfile = tmp_path / "dashboard.prom"
+    metrics = StageMetrics(textfile_interval=0)
+
+    def run():
+        for _ in range(RUNS):
+            export_trace(make_trace(), metrics, textfile=textfile)
+
+    threads = [threading.Thread(target=run) for _ in range(THREADS)]
+    with caplog.at_level(logging.WARNING, logger="dashboard.metrics"):
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert not caplog.records
+    assert [path.name for path in tmp_path.iterdir()] == ["dashboard.prom"]
+    metrics.write_textfile(textfile)
+    assert f'dashboard_reruns_total{{scope="app"}} {THREADS * RUNS}' in textfile.read_text(encoding="utf-8")
+
+
+def test_textfile_is_throttled(tmp_path, monkeypatch):
+    metrics = StageMetrics(textfile_interval=60)
+    writes = []
+    monkeypatch.setattr(metrics, "write_textfile", writes.append)
+
+    for _ in range(50):
+        export_trace(make_trace(), metrics, textfile=tmp_path / "dashboard.prom")
+
+    assert len(writes) == 1
+    assert metrics.reruns["app"] == 50
@@ -0,0 +1,87 @@
+"""
+기간별 결과 LRU 캐시
+maxsize를 넘으면 가장 오래 안 쓴 기간부터 버리고, 새 데이터 버전이 들어오면 이전 버전 결과를 비우며,
+계산 중에 새 버전이 들어온 이전 버전 결과는 저장하지 않아야 한다.
+"""
+from datetime import date, timedelta
+
+from memo import RangeMemo
+
+END = date(2025, 1, 31)
+
+
+def period(days):
+    return END - timedelta(days=days - 1), END
+
+
+class CountingBuilder:
+    """호출 횟수를 세는 build 함수"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return {'call': self.calls}
+
+
+def test_hit_and_miss_counters():
+    memo, build = RangeMemo(4), CountingBuilder()
+
+    first, hit = memo.get(*period(7), 1, build)
+    assert not hit
+    again, hit = memo.get(*period(7), 1, build)
+    assert hit and again is first
+    assert build.calls == 1
+    assert memo.stats() == {'hits': 1, 'misses': 1, 'size': 1, 'maxsize': 4}
+
+
+def test_evicts_least_recently_used_at_maxsize():
+    memo, build = RangeMemo(2), CountingBuilder()
+    memo.get(*period(1), 1, build)
+    memo.get(*period(7), 1, build)
+    memo.get(*period(1), 1, build)     # 7일이 가장 오래 안 쓴 기간이 됨
+    memo.get(*period(30), 1, build)
+
+    assert memo.stats()['size'] == 2
+    assert memo.get(*period(1), 1, build)[1]
+    assert memo.get(*period(30), 1, build)[1]
+    assert not memo.get(*period(7), 1, build)[1]
+    assert build.calls == 4
+
+
+def test_new_version_clears_previous_entries():
+    memo, build = RangeMemo(4), CountingBuilder()
+    memo.get(*period(1), 1, build)
+    memo.get(*period(7), 1, build)
+
+    value, hit = memo.get(*period(1), 2, build)
+    assert not hit and value == {'call': 3}
+    assert memo.stats()['size'] == 1
+    assert memo.version == 2
+
+
+def test_stale_version_is_not_stored():
+    memo, build = RangeMemo(4), CountingBuilder()
+
+    def build_during_refresh():
+        # 계산 중에 다른 세션이 새 버전 결과를 저장
+        memo.get(*period(30), 2, build)
+        return build()
+
+    value, hit = memo.get(*period(7), 1, build_during_refresh)
+    assert not hit and value == {'call': 2}
+    assert memo.version == 2
+    assert memo.stats()['size'] == 1
+    assert not memo.get(*period(7), 1, build)[1]
+    assert memo.get(*period(30), 2, build)[1]
+
+
+def test_clear():
+    memo, build = RangeMemo(4), CountingBuilder()
+    memo.get(*period(7), 1, build)
+    memo.clear()
+
+    assert memo.stats()['size'] == 0
+    assert not memo.get(*period(7), 1, build)[1]
+    assert build.calls == 2
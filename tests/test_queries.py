@@ -0,0 +1,28 @@
+"""
+요약 테이블 상태 조회
+summary_state 테이블이 없을 때만 None(원본 집계로 대체)이고, 그 밖의 DB 오류는 그대로 올라와야 한다.
+"""
+import sqlite3
+
+import pytest
+
+from queries import get_summary_until
+from standin import StandInConnection
+
+
+def test_missing_summary_state_falls_back(standin_path):
+    conn = StandInConnection(standin_path)
+    try:
+        assert get_summary_until(conn, 'ai_response') is None
+    finally:
+        conn.close()
+
+
+def test_other_errors_are_raised(tmp_path):
+    conn = StandInConnection(tmp_path / "broken.db")
+    conn.raw.execute("CREATE TABLE summary_state (table_name TEXT)")
+    try:
+        with pytest.raises(sqlite3.OperationalError, match="no such column"):
+            get_summary_until(conn, 'ai_response')
+    finally:
+        conn.close()
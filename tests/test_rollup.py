@@ -0,0 +1,62 @@
+"""
+누적합 기간 합계
+DailyRollup.totals()가 일자별 집계를 기간으로 걸러서 더한 값과 같은지 확인한다.
+"""
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from rollup import API_COST_PER_CALL, ROLLUP_COLUMNS, DailyRollup
+
+
+def daily(days, **columns):
+    index = pd.DatetimeIndex([pd.Timestamp(day) for day in days], name='date')
+    return pd.DataFrame(columns, index=index).astype('int64')
+
+
+# 1/3, 1/6은 한 테이블에만 데이터가 있는 날
+DF_AI = daily([date(2025, 1, 1), date(2025, 1, 2), date(2025, 1, 4), date(2025, 1, 5)],
+              token_sum=[100, 200, 300, 400], count=[1, 2, 3, 4])
+DF_MODEL = daily([date(2025, 1, 2), date(2025, 1, 3), date(2025, 1, 5)],
+                 total_count=[10, 20, 30], standardized=[5, 6, 7])
+DF_PHOTO = daily([date(2025, 1, 1), date(2025, 1, 5), date(2025, 1, 6)],
+                 count_sum=[7, 8, 9], sgno_count=[1, 1, 2], web_open_chk=[0, 1, 1])
+
+
+def filtered_totals(start_date, end_date):
+    """기간 필터 후 합계 (누적합 도입 전 방식)"""
+    def total(frame, col):
+        mask = (frame.index >= pd.Timestamp(start_date)) & (frame.index <= pd.Timestamp(end_date))
+        return frame.loc[mask, col].sum()
+
+    count = total(DF_AI, 'count')
+    return {
+        'token_sum': total(DF_AI, 'token_sum'), 'count': count, 'cost': count * API_COST_PER_CALL,
+        'model_count': total(DF_MODEL, 'total_count'), 'standardized': total(DF_MODEL, 'standardized'),
+        'sgno_count': total(DF_PHOTO, 'sgno_count'), 'image_count': total(DF_PHOTO, 'count_sum'),
+        'web_open_chk': total(DF_PHOTO, 'web_open_chk'),
+    }
+
+
+@pytest.mark.parametrize("start_date, end_date", [
+    (date(2025, 1, 1), date(2025, 1, 6)),       # 전체
+    (date(2025, 1, 2), date(2025, 1, 4)),       # 일부
+    (date(2024, 12, 25), date(2025, 1, 2)),     # 앞쪽 일부만 겹침
+    (date(2025, 1, 5), date(2025, 1, 20)),      # 뒤쪽 일부만 겹침
+    (date(2025, 1, 3), date(2025, 1, 3)),       # 하루
+    (date(2025, 2, 1), date(2025, 2, 10)),      # 데이터 없는 기간
+    (date(2025, 1, 5), date(2025, 1, 2)),       # 시작일 > 종료일
+    (date(2025, 1, 20), date(2024, 12, 1)),     # 시작일 > 종료일 (전체 범위 밖)
+])
+def test_totals_match_filtered_sum(start_date, end_date):
+    totals = DailyRollup(DF_AI, DF_MODEL, DF_PHOTO).totals(start_date, end_date)
+
+    assert totals == filtered_totals(start_date, end_date)
+    assert all(totals[col] >= 0 for col in ROLLUP_COLUMNS)
+
+
+def test_inverted_range_is_empty():
+    totals = DailyRollup(DF_AI, DF_MODEL, DF_PHOTO).totals(date(2025, 1, 5), date(2025, 1, 2))
+
+    assert totals == {col: 0 for col in ROLLUP_COLUMNS}
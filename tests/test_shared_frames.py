@@ -0,0 +1,41 @@
+"""
+공유 프레임 보호
+저장소 프레임은 모든 세션이 같이 읽으므로, get_frames()로 받은 프레임에 값을 쓰거나
+기간별 표/롤업을 만들어도 저장소 상태는 바뀌지 않아야 한다.
+"""
+from datetime import date, timedelta
+
+import pytest
+
+from aggregates import build_range_tables
+from rollup import DailyRollup, calculate_period_stats
+
+# pandas는 sqlite3 이외의 DBAPI 연결(대체 DB)에 경고를 출력함
+pytestmark = pytest.mark.filterwarnings("ignore::UserWarning")
+
+
+def test_writes_to_returned_frames_do_not_reach_the_store(loaded_store):
+    state = loaded_store.state
+    df_ai, df_model, df_photo = loaded_store.get_frames()
+    df_ai['count'] = 0
+    df_model.loc[:, 'total_count'] = -1
+    df_photo.iloc[0, 0] = -1
+    df_photo.drop(columns=['sgno_count'], inplace=True)
+
+    assert state.modified_tables() == []
+    assert 'sgno_count' in loaded_store.get_frames()[2].columns
+
+
+def test_range_tables_and_rollup_do_not_modify_the_store(loaded_store):
+    state = loaded_store.state
+    today = date.today()
+    for start_date in (today - timedelta(days=6), today - timedelta(days=29)):
+        tables = build_range_tables(state.get_frames(), state.rollup, start_date, today)
+        for name in ('api_df', 'model_df', 'photo_df'):
+            tables[name].iloc[:, 1:] = 0
+    rollup = DailyRollup(*state.get_frames())
+    for days_ago in (1, 7, 30):
+        calculate_period_stats(rollup, days_ago)
+        calculate_period_stats(state.rollup, days_ago)
+
+    assert state.modified_tables() == []
@@ -0,0 +1,94 @@
+"""
+증분 새로고침
+high-water mark - late_days 이후 구간만 다시 조회하므로, 새로고침 후 그 구간은 DB에서 새로 읽은 결과와 같고
+그 이전에 늦게 들어온 행은 전체 다시 적재(reload) 때만 반영된다.
+"""
+import sqlite3
+from datetime import date, datetime, time, timedelta
+
+import pandas as pd
+import pytest
+
+from standin import INSERT_SQL, QueryCounter, connection_factory, create_database
+from store import TABLES, DailyStore, slice_range
+
+pytestmark = pytest.mark.filterwarnings("ignore::UserWarning")
+
+LATE_DAYS = 3
+TODAY = date.today()
+# 데이터는 이틀 전까지만 있으므로 high-water mark는 TODAY - 2, 다시 조회하는 구간은 TODAY - 5부터
+DATA_END = TODAY - timedelta(days=2)
+WINDOW_START = DATA_END - timedelta(days=LATE_DAYS)
+INSIDE_WINDOW = TODAY - timedelta(days=4)
+OUTSIDE_WINDOW = TODAY - timedelta(days=10)
+
+NEW_ROWS = {
+    'ai_response': (1, 500),
+    'model_create': (1, 1),
+    'photo_upload': ('SG-new', 5, 1),
+}
+
+
+def insert_rows(path, day, count):
+    stamp = datetime.combine(day, time(12, 0)).isoformat(sep=' ')
+    conn = sqlite3.connect(path)
+    try:
+        for table, values in NEW_ROWS.items():
+            conn.executemany(INSERT_SQL[table], [(*values, stamp)] * count)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def load(path, counter=None):
+    store = DailyStore(connection_factory(path, counter), late_days=LATE_DAYS)
+    store.ensure_range(TODAY - timedelta(days=29), TODAY)
+    return store
+
+
+def assert_frames_equal(store, expected, start_date, end_date):
+    for table, frame, expected_frame in zip(TABLES, store.get_frames(), expected.get_frames()):
+        # 조회 구간마다 downcast 결과 폭(int8/int16 등)이 다를 수 있으므로 값만 비교
+        pd.testing.assert_frame_equal(slice_range(frame, start_date, end_date),
+                                      slice_range(expected_frame, start_date, end_date),
+                                      check_dtype=False, obj=table)
+
+
+@pytest.fixture
+def refresh_path(tmp_path):
+    return create_database(2000, days=60, path=tmp_path / "refresh.db", today=DATA_END)
+
+
+def test_refresh_merges_only_the_late_arrival_window(refresh_path):
+    counter = QueryCounter()
+    store = load(refresh_path, counter)
+    assert all(store.high_water[table] == DATA_END for table in TABLES)
+    before = store.get_frames()
+    version = store.version
+
+    insert_rows(refresh_path, TODAY, 3)
+    insert_rows(refresh_path, INSIDE_WINDOW, 2)
+    insert_rows(refresh_path, OUTSIDE_WINDOW, 4)
+    store.refresh(max_age=0)
+
+    assert store.version > version
+    assert all(store.high_water[table] == TODAY for table in TABLES)
+    # 새로고침 구간은 DB에서 새로 적재한 결과와 같음
+    fresh = load(refresh_path)
+    assert_frames_equal(store, fresh, WINDOW_START, TODAY)
+    # 구간 밖에 늦게 들어온 행은 반영되지 않음 (이전 값 그대로)
+    for frame, old_frame in zip(store.get_frames(), before):
+        pd.testing.assert_frame_equal(slice_range(frame, OUTSIDE_WINDOW, OUTSIDE_WINDOW),
+                                      slice_range(old_frame, OUTSIDE_WINDOW, OUTSIDE_WINDOW))
+    outside = pd.Timestamp(OUTSIDE_WINDOW)
+    assert fresh.get_frames()[0].loc[outside, 'count'] == store.get_frames()[0].loc[outside, 'count'] + 4
+    assert store.get_frames()[0].loc[pd.Timestamp(TODAY), 'count'] == 3
+
+    # 이미 적재한 범위는 다시 조회하지 않음
+    queries = counter.value
+    store.ensure_range(TODAY - timedelta(days=7), TODAY)
+    assert counter.value == queries
+
+    # 전체 다시 적재하면 구간 밖의 늦은 행도 반영됨
+    store.reload()
+    assert_frames_equal(store, fresh, TODAY - timedelta(days=29), TODAY)